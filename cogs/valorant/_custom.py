@@ -11,6 +11,11 @@ from ._enums import AbilitiesEmoji, AgentEmoji, ContentTierEmoji, GameModeEmoji,
 if TYPE_CHECKING:
     from ._client import Client
 
+# content tiers are a fixed set, so resolve their emojis once instead of per skin
+CONTENT_TIER_EMOJIS: Dict[str, str] = {tier.name.capitalize(): tier.value for tier in ContentTierEmoji}
+# parsed highlight colours keyed by content tier uuid
+CONTENT_TIER_COLOURS: Dict[str, int] = {}
+
 
 class Ability(valorantx.AgentAbility):
     def __init__(self, client: Client, data: Dict[str, Any], agent: Optional[valorantx.Agent] = None) -> None:
@@ -65,7 +70,15 @@ class CompetitiveTier(valorantx.CompetitiveTier):
 class ContentTier(valorantx.ContentTier):
     @property
     def emoji(self) -> str:
-        return ContentTierEmoji.get(self.dev_name)
+        return CONTENT_TIER_EMOJIS.get(self.dev_name) or ContentTierEmoji.get(self.dev_name)
+
+    @property
+    def highlight_colour(self) -> int:
+        """:class: `int` Returns the content tier's highlight colour without the alpha channel."""
+        colour = CONTENT_TIER_COLOURS.get(self.uuid)
+        if colour is None:
+            colour = CONTENT_TIER_COLOURS[self.uuid] = int(self.highlight_color[0:6], 16)
+        return colour
 
 
 class MatchRoundResult(match.RoundResult):
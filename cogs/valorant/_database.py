@@ -7,7 +7,13 @@ from typing import TYPE_CHECKING, Any, AnyStr, Dict, List, Optional, Union
 import discord
 
 from ._client import RiotAuth
-from ._sql_statements import ACCOUNT_DELETE, ACCOUNT_DELETE_BY_GUILD, ACCOUNT_SELECT, ACCOUNT_SELECT_ALL, ACCOUNT_UPSERT
+from ._sql_statements import (
+    ACCOUNT_DELETE,
+    ACCOUNT_DELETE_BY_GUILD,
+    ACCOUNT_INSERT_OR_UPDATE,
+    ACCOUNT_SELECT,
+    ACCOUNT_SELECT_ALL,
+)
 
 if TYPE_CHECKING:
     import asyncpg
@@ -154,19 +160,18 @@ class Database:
         user_id: int,
         guild_id: int,
         locale: discord.Locale,
-        date_signed: Optional[datetime.datetime] = datetime.datetime.now(),
+        date_signed: Optional[datetime.datetime] = None,
         *,
         conn: Optional[asyncpg.Pool] = None,
     ) -> str:
         conn = conn or self.pool
         return await conn.execute(
-            ACCOUNT_UPSERT,
+            ACCOUNT_INSERT_OR_UPDATE,
             user_id,
             guild_id,
             data,
-            date_signed,
+            date_signed or datetime.datetime.now(),
             str(locale),
-            user_id,
         )
 
     async def delete_by_guild(self, guild_id: int, *, conn: Optional[asyncpg.Pool] = None) -> List[asyncpg.Record]:
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import copy
 import datetime
+import heapq
+import operator
 import random
-from typing import TYPE_CHECKING, Any, Iterable, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple, Union
 
 import discord
 import valorantx
@@ -38,8 +41,60 @@ SkinItem = Union[valorantx.Skin, valorantx.SkinLevel, valorantx.SkinChroma]
 SprayItem = Union[valorantx.Spray, valorantx.SprayLevel]
 BuddyItem = Union[valorantx.Buddy, valorantx.BuddyLevel]
 
+# game modes whose match embeds have no round timeline
+NO_TIMELINE_MODES = frozenset((str(GameModeType.escalation), str(GameModeType.deathmatch)))
+
+# store headers, the translated part is looked up per call since it follows the current locale
+STORE_HEADER = '{header}Resets {reset}'
+NIGHTMARKET_HEADER = 'NightMarket for {user}\nExpires {expire}'
+
+# deathmatch placings with an irregular suffix, the rest are '{n}TH'
+PLACE_SUFFIXES = {1: '1ST', 2: '2ND', 3: '3RD'}
+
+DEFAULT_LOCALE = valorantx.Locale.american_english
+_DEFAULT_LOCALE_CODE = str(DEFAULT_LOCALE)
+
+# localized skin names keyed by (skin uuid, locale code)
+SKIN_NAMES: Dict[Tuple[str, str], str] = {}
+
+_acs_key = operator.attrgetter('acs')
+_kills_key = operator.attrgetter('kills')
+_score_key = operator.attrgetter('score')
+
+
+def _opponent_name_key(player: Any) -> str:
+    return player.opponent.display_name.casefold()
+
+
+def deathmatch_placement(players: List[match.MatchPlayer], me: match.MatchPlayer) -> Optional[str]:
+    # players must be ranked by kills, returns None when me is not among them
+    index = next((i for i, p in enumerate(players) if p is me), None)
+    if index is None:
+        return None
+
+    place = index + 1
+    result = PLACE_SUFFIXES.get(place, f'{place}TH') + ' PLACE'
+    if (index > 0 and players[index - 1].kills == me.kills) or (
+        place < len(players) and players[place].kills == me.kills
+    ):
+        result += ' (TIED)'
+    return result
+
+
+def _extend_fields(embed: discord.Embed, fields: Iterable[Tuple[str, str]], inline: bool = True) -> None:
+    # same shape as discord.Embed.add_field, appended in one go
+    new_fields = [{'inline': inline, 'name': str(n), 'value': str(v)} for n, v in fields]
+    if not new_fields:
+        return
+    try:
+        embed._fields.extend(new_fields)
+    except AttributeError:
+        embed._fields = new_fields
+
 
 class Embed(discord.Embed):
+    __slots__ = ()
+
     def __init__(
         self,
         color: Union[discord.Color, int] = 0xFD4554,
@@ -48,18 +103,30 @@ class Embed(discord.Embed):
         **kwargs,
     ):
         super().__init__(color=color, **kwargs)
-        for n, v in fields:
-            self.add_field(name=n, value=v, inline=field_inline)
+        _extend_fields(self, fields, inline=field_inline)
+
+
+def _locale_code(locale: Optional[valorantx.Locale]) -> str:
+    return _DEFAULT_LOCALE_CODE if locale is DEFAULT_LOCALE else str(locale)
+
+
+def _skin_name(skin: SkinItem, locale: str) -> str:
+    # the skin catalogue is fixed per patch, so this stays bounded by skins x locales
+    key = (skin.uuid, locale)
+    name = SKIN_NAMES.get(key)
+    if name is None:
+        name = SKIN_NAMES[key] = skin.name_localizations.from_locale(locale)
+    return name
 
 
 def skin_e(
     skin: Union[valorantx.Skin, valorantx.SkinLevel, valorantx.SkinChroma],
-    locale: valorantx.Locale,
+    locale: str,
     *,
     is_nightmarket: bool = False,
 ) -> discord.Embed:
     embed = Embed(
-        title=f"{skin.rarity.emoji} {bold(skin.name_localizations.from_locale(str(locale)))}",
+        title=f"{skin.rarity.emoji} {bold(_skin_name(skin, locale))}",
         colour=Theme.purple,
     )
 
@@ -76,7 +143,7 @@ def skin_e(
         embed.set_thumbnail(url=skin.display_icon)
 
     if skin.rarity is not None:
-        embed.colour = int(skin.rarity.highlight_color[0:6], 16)
+        embed.colour = skin.rarity.highlight_colour  # type: ignore
 
     return embed
 
@@ -85,18 +152,16 @@ def store_e(
     store: valorantx.StoreOffer, riot_auth: RiotAuth, *, locale: Optional[valorantx.Locale] = None
 ) -> List[discord.Embed]:
 
-    locale = riot_auth.locale if locale is None else locale
+    locale_code = _locale_code(riot_auth.locale if locale is None else locale)
 
-    embeds = [
-        Embed(
-            description=_('Daily store for {user}\n').format(user=bold(riot_auth.display_name))
-            + f'Resets {format_relative(store.reset_at)}',
-            colour=Theme.purple,
-        )
-    ]
+    description = STORE_HEADER.format(
+        header=_('Daily store for {user}\n').format(user=bold(riot_auth.display_name)),
+        reset=format_relative(store.reset_at),
+    )
+    embeds = [Embed(description=description, colour=Theme.purple)]
 
     for skin in store.get_skins():
-        embeds.append(skin_e(skin, locale))
+        embeds.append(skin_e(skin, locale_code))
 
     return embeds
 
@@ -105,18 +170,16 @@ def nightmarket_e(
     nightmarket: valorantx.NightMarketOffer, riot_auth: RiotAuth, *, locale: Optional[valorantx.Locale] = None
 ) -> List[discord.Embed]:
 
-    locale = riot_auth.locale if locale is None else locale
+    locale_code = _locale_code(riot_auth.locale if locale is None else locale)
 
-    embeds = [
-        Embed(
-            description=f'NightMarket for {bold(riot_auth.display_name)}\n'
-            f'Expires {format_relative(nightmarket.expire_at)}',
-            colour=Theme.purple,
-        )
-    ]
+    description = NIGHTMARKET_HEADER.format(
+        user=bold(riot_auth.display_name),
+        expire=format_relative(nightmarket.expire_at),
+    )
+    embeds = [Embed(description=description, colour=Theme.purple)]
 
     for skin in nightmarket.get_skins():
-        embeds.append(skin_e(skin, locale, is_nightmarket=True))
+        embeds.append(skin_e(skin, locale_code, is_nightmarket=True))
 
     return embeds
 
@@ -128,21 +191,24 @@ def wallet_e(
     vp = wallet.get_valorant()
     rad = wallet.get_radiant()
 
-    vp_name = vp.name_localizations.from_locale(str(locale))
+    locale_code = _locale_code(locale)
+    vp_name = vp.name_localizations.from_locale(locale_code)
+    if vp_name == 'VP':
+        vp_name = 'Valorant'
+    rad_name = rad.name_localizations.from_locale(locale_code).removesuffix(' Points')
 
-    embed = embed = Embed(title=f'{riot_auth.display_name} Point:')
-
-    embed.add_field(
-        name=f'{(vp_name if vp_name != "VP" else "Valorant")}',
-        value=f'{vp.emoji} {wallet.valorant_points}',  # type: ignore
-    )
-    embed.add_field(
-        name=f'{rad.name_localizations.from_locale(str(locale)).removesuffix(" Points")}',
-        value=f'{rad.emoji} {wallet.radiant_points}',  # type: ignore
-    )
+    embed = Embed(title=f'{riot_auth.display_name} Point:')
+    embed.add_field(name=vp_name, value=f'{vp.emoji} {wallet.valorant_points}')  # type: ignore
+    embed.add_field(name=rad_name, value=f'{rad.emoji} {wallet.radiant_points}')  # type: ignore
     return embed
 
 
+GAME_PASS_NAMES: Dict[valorantx.RelationType, str] = {
+    valorantx.RelationType.agent: 'Agent',
+    valorantx.RelationType.event: 'Eventpass',
+}
+
+
 def game_pass_e(
     reward: contract.Reward,
     contract: contract.ContractU,
@@ -155,23 +221,12 @@ def game_pass_e(
 
     item = reward.get_item()
 
-    if relation_type is valorantx.RelationType.agent:
-        display_name = 'Agent'
-    elif relation_type is valorantx.RelationType.event:
-        display_name = 'Eventpass'
-    else:
-        display_name = 'Battlepass'
-    embed = discord.Embed(
-        title='{gamepass} for {display_name}'.format(gamepass=display_name, display_name=bold(riot_auth.display_name))
-    )
-    embed.set_footer(
-        text='TIER {tier} | {gamepass}'.format(
-            tier=page + 1, gamepass=contract.name_localizations.from_locale(str(locale))
-        )
-    )
+    display_name = GAME_PASS_NAMES.get(relation_type, 'Battlepass')
+    embed = discord.Embed(title=f'{display_name} for {bold(riot_auth.display_name)}')
+    embed.set_footer(text=f'TIER {page + 1} | {contract.name_localizations.from_locale(_locale_code(locale))}')
 
     if item is not None:
-        embed.description = '{item}'.format(item=item.display_name)
+        embed.description = f'{item.display_name}'
         if not isinstance(item, valorantx.PlayerTitle):
             if item.display_icon is not None:
                 if isinstance(item, valorantx.SkinLevel):
@@ -193,25 +248,26 @@ def mission_e(
     weekly = []
     tutorial = []
     npe = []
+    missions_by_type = {
+        MissionType.daily: daily,
+        MissionType.weekly: weekly,
+        MissionType.tutorial: tutorial,
+        MissionType.npe: npe,
+    }
 
     all_completed = True
 
-    daily_format = '{0} | **+ {1.xp:,} XP**\n- **`{1.progress}/{1.target}`**'
+    locale_code = _locale_code(locale)
+    daily_format = '{0} | **+ {1.xp:,} XP**\n- **`{1.progress}/{1.target}`**'.format
     for mission in contracts.missions:
-        title = mission.title_localizations.from_locale(str(locale))
-        if mission.type == MissionType.daily:
-            daily.append(daily_format.format(title, mission))
-        elif mission.type == MissionType.weekly:
-            weekly.append(daily_format.format(title, mission))
-        elif mission.type == MissionType.tutorial:
-            tutorial.append(daily_format.format(title, mission))
-        elif mission.type == MissionType.npe:
-            npe.append(daily_format.format(title, mission))
-
-        if not mission.is_completed():
+        missions = missions_by_type.get(mission.type)
+        if missions is not None:
+            missions.append(daily_format(mission.title_localizations.from_locale(locale_code), mission))
+
+        if all_completed and not mission.is_completed():
             all_completed = False
 
-    embed = Embed(title='{display_name} Mission:'.format(display_name=riot_auth.display_name))
+    embed = Embed(title=f'{riot_auth.display_name} Mission:')
     if all_completed:
         embed.colour = 0x77DD77
 
@@ -251,29 +307,31 @@ def mission_e(
     return embed
 
 
-def skin_loadout_e(skin: SkinLoadout, *, locale: valorantx.Locale = valorantx.Locale.american_english) -> discord.Embed:
+def skin_loadout_e(skin: SkinLoadout, *, locale: valorantx.Locale = DEFAULT_LOCALE) -> discord.Embed:
+
+    locale_code = _locale_code(locale)
 
     if isinstance(skin, valorantx.SkinChromaLoadout):
         _skin = skin.get_skin()
         if _skin is not None:
-            skin_dn = _skin.name_localizations.from_locale(str(locale))
+            skin_dn = _skin.name_localizations.from_locale(locale_code)
         else:
-            skin_dn = skin.name_localizations.from_locale(str(locale))
+            skin_dn = skin.name_localizations.from_locale(locale_code)
     else:
-        skin_dn = skin.name_localizations.from_locale(str(locale))
+        skin_dn = skin.name_localizations.from_locale(locale_code)
 
     embed = discord.Embed(
         description=(skin.rarity.emoji if skin.rarity is not None else '')  # type: ignore
         + ' '
         + bold(skin_dn)
         + (' ★' if skin.is_favorite() else ''),
-        colour=int(skin.rarity.highlight_color[0:6], 16) if skin.rarity is not None else Theme.dark,
+        colour=skin.rarity.highlight_colour if skin.rarity is not None else Theme.dark,  # type: ignore
     )
     embed.set_thumbnail(url=skin.display_icon)
 
     buddy = skin.get_buddy()
     if buddy is not None:
-        buddy_dn = buddy.name_localizations.from_locale(str(locale))
+        buddy_dn = buddy.name_localizations.from_locale(locale_code)
         embed.set_footer(
             text=f'{buddy_dn}' + (' ★' if buddy.is_favorite() else ''),
             icon_url=buddy.display_icon,
@@ -281,10 +339,8 @@ def skin_loadout_e(skin: SkinLoadout, *, locale: valorantx.Locale = valorantx.Lo
     return embed
 
 
-def spray_loadout_e(
-    spray: SprayLoadout, slot: int, *, locale: valorantx.Locale = valorantx.Locale.american_english
-) -> discord.Embed:
-    spray_dn = spray.name_localizations.from_locale(str(locale))
+def spray_loadout_e(spray: SprayLoadout, slot: int, *, locale: valorantx.Locale = DEFAULT_LOCALE) -> discord.Embed:
+    spray_dn = spray.name_localizations.from_locale(_locale_code(locale))
     embed = discord.Embed(description=bold(str(slot) + '. ' + spray_dn) + (' ★' if spray.is_favorite() else ''))
     spray_icon = spray.animation_gif or spray.full_transparent_icon or spray.display_icon
     if spray_icon is not None:
@@ -303,35 +359,36 @@ def patch_notes_e(pn: valorantx.PatchNote, banner_url: Optional[str] = None) ->
     return embed
 
 
-def agent_e(agent: valorantx.Agent, *, locale: valorantx.Locale = valorantx.Locale.american_english) -> discord.Embed:
+def agent_e(agent: valorantx.Agent, *, locale: valorantx.Locale = DEFAULT_LOCALE) -> discord.Embed:
+    locale_code = _locale_code(locale)
     embed = Embed(
-        title=agent.name_localizations.from_locale(str(locale)),
-        description=italics(agent.description_localizations.from_locale(str(locale))),
+        title=agent.name_localizations.from_locale(locale_code),
+        description=italics(agent.description_localizations.from_locale(locale_code)),
         colour=int(random.choice(agent.background_gradient_colors)[:-2], 16),
     )
     embed.set_image(url=agent.full_portrait)
     embed.set_thumbnail(url=agent.display_icon)
     embed.set_footer(
-        text=agent.role.name_localizations.from_locale(str(locale)),
+        text=agent.role.name_localizations.from_locale(locale_code),
         icon_url=agent.role.display_icon,
     )
     return embed
 
 
 def buddy_e(
-    buddy: Union[valorantx.Buddy, valorantx.BuddyLevel], *, locale: valorantx.Locale = valorantx.Locale.american_english
+    buddy: Union[valorantx.Buddy, valorantx.BuddyLevel], *, locale: valorantx.Locale = DEFAULT_LOCALE
 ) -> discord.Embed:
     embed = Embed(colour=Theme.purple)
     if isinstance(buddy, valorantx.Buddy):
         embed.set_author(
-            name=buddy.name_localizations.from_locale(str(locale)),
+            name=buddy.name_localizations.from_locale(_locale_code(locale)),
             icon_url=buddy.theme.display_icon if buddy.theme is not None else None,
             url=buddy.display_icon,
         )
 
     elif isinstance(buddy, valorantx.BuddyLevel):
         embed.set_author(
-            name=buddy._base_buddy.name_localizations.from_locale(str(locale)),
+            name=buddy._base_buddy.name_localizations.from_locale(_locale_code(locale)),
             url=buddy.display_icon,
             icon_url=buddy._base_buddy.theme.display_icon if buddy._base_buddy.theme is not None else None,
         )
@@ -341,39 +398,29 @@ def buddy_e(
 
 
 def spray_e(
-    spray: Union[valorantx.Spray, valorantx.SprayLevel], *, locale: valorantx.Locale = valorantx.Locale.american_english
+    spray: Union[valorantx.Spray, valorantx.SprayLevel], *, locale: valorantx.Locale = DEFAULT_LOCALE
 ) -> discord.Embed:
     embed = Embed(colour=Theme.purple)
 
-    if isinstance(spray, valorantx.Spray):
-        embed.set_author(
-            name=spray.name_localizations.from_locale(str(locale)),
-            url=spray.display_icon,
-            icon_url=spray.theme.display_icon if spray.theme is not None else None,
-        )
-        embed.set_image(url=spray.animation_gif or spray.full_transparent_icon or spray.display_icon)
-
-    elif isinstance(spray, valorantx.SprayLevel):
-        base_spray = spray.get_base_spray()
-        embed.set_author(
-            name=base_spray.name_localizations.from_locale(str(locale)),
-            icon_url=base_spray.theme.display_icon if base_spray.theme is not None else None,
-            url=spray.display_icon,
-        )
-        embed.set_image(
-            url=base_spray.animation_gif
-            or base_spray.full_transparent_icon
-            or base_spray.display_icon
-            or spray.display_icon
-        )
+    base_spray = spray if isinstance(spray, valorantx.Spray) else spray.get_base_spray()
+    embed.set_author(
+        name=base_spray.name_localizations.from_locale(_locale_code(locale)),
+        url=spray.display_icon,
+        icon_url=base_spray.theme.display_icon if base_spray.theme is not None else None,
+    )
+    embed.set_image(
+        url=base_spray.animation_gif
+        or base_spray.full_transparent_icon
+        or base_spray.display_icon
+        or spray.display_icon
+    )
+    return embed
 
 
-def player_card_e(
-    player_card: valorantx.PlayerCard, *, locale: valorantx.Locale = valorantx.Locale.american_english
-) -> discord.Embed:
+def player_card_e(player_card: valorantx.PlayerCard, *, locale: valorantx.Locale = DEFAULT_LOCALE) -> discord.Embed:
     embed = Embed(colour=Theme.purple)
     embed.set_author(
-        name=player_card.name_localizations.from_locale(str(locale)),
+        name=player_card.name_localizations.from_locale(_locale_code(locale)),
         icon_url=player_card.theme.display_icon if player_card.theme is not None else None,
         url=player_card.large_icon,
     )
@@ -385,26 +432,22 @@ def bundle_item_e(
     item: Union[BundleItem, FeaturedBundleItem],
     is_featured: bool = False,
     *,
-    locale: valorantx.Locale = valorantx.Locale.american_english,
+    locale: valorantx.Locale = DEFAULT_LOCALE,
 ) -> discord.Embed:
     emoji = item.rarity.emoji if isinstance(item, valorantx.Skin) else ''  # type: ignore
 
+    if not is_featured or item.is_melee():
+        price = f'{bold("FREE")} {strikethrough(item.price)}' if is_featured else f' {item.price}'
+    elif item.discounted_price != item.price and item.discounted_price != 0:
+        price = f'{bold(str(item.discounted_price))} {strikethrough(str(item.price))}'
+    else:
+        price = str(item.price)
+
     embed = Embed(
-        title='{rarity} {name}'.format(rarity=emoji, name=bold(item.name_localizations.from_locale(str(locale)))),
-        description='{emoji} '.format(emoji=PointEmoji.valorant),
+        title=f'{emoji} {bold(item.name_localizations.from_locale(_locale_code(locale)))}',
+        description=f'{PointEmoji.valorant} {price}',
         colour=Theme.dark,
     )
-    if not is_featured or item.is_melee():
-        embed.description += '{free} {price}'.format(
-            free=(bold('FREE') if is_featured else ''), price=(strikethrough(item.price) if is_featured else item.price)
-        )
-    else:
-        if item.discounted_price != item.price and item.discounted_price != 0:
-            embed.description += '{discounted} {price}'.format(
-                discounted=bold(str(item.discounted_price)), price=strikethrough(str(item.price))
-            )
-        else:
-            embed.description += str(item.price)
 
     if isinstance(item, valorantx.PlayerCard):
         item_icon = item.large_icon
@@ -420,10 +463,32 @@ def bundle_item_e(
     return embed
 
 
+# bundle items are shown melee first, then skins, buddies, cards, sprays and the rest
+BUNDLE_ITEM_PRIORITIES: Tuple[Tuple[Any, int], ...] = (
+    (SkinItem, 1),
+    (BuddyItem, 2),
+    (valorantx.PlayerCard, 3),
+    (SprayItem, 4),
+)
+_bundle_type_priorities: Dict[type, int] = {}
+
+
+def _bundle_item_priority(item: Union[BundleItem, FeaturedBundleItem]) -> int:
+    if item.is_melee():
+        return 0
+
+    cls = type(item)
+    priority = _bundle_type_priorities.get(cls)
+    if priority is None:
+        priority = next((p for types, p in BUNDLE_ITEM_PRIORITIES if issubclass(cls, types)), 5)
+        _bundle_type_priorities[cls] = priority
+    return priority
+
+
 def bundle_e(
     bundle: Union[valorantx.Bundle, valorantx.FeaturedBundle],
     *,
-    locale: valorantx.Locale = valorantx.Locale.american_english,
+    locale: valorantx.Locale = DEFAULT_LOCALE,
 ) -> List[discord.Embed]:
     embeds = []
 
@@ -431,174 +496,258 @@ def bundle_e(
     if bundle.display_icon_2 is not None:
         embed.set_image(url=bundle.display_icon_2)
 
-    if isinstance(bundle, valorantx.FeaturedBundle):
-        embed.description = 'Featured Bundle: {bundle}\n{emoji} {price} {strikethrough} {expires}'.format(
-            bundle=bold(bundle.name_localizations.from_locale(str(locale)) + ' Collection'),
-            emoji=PointEmoji.valorant,
-            price=bold(str(bundle.discount_price)),
-            strikethrough=strikethrough(str(bundle.price)),
-            expires=italics('(Expires {expires})'.format(expires=format_relative(bundle.expires_at))),
+    is_featured = isinstance(bundle, valorantx.FeaturedBundle)
+    bundle_name = bold(bundle.name_localizations.from_locale(_locale_code(locale)) + ' Collection')
+
+    if is_featured:
+        embed.description = (
+            f'Featured Bundle: {bundle_name}\n'
+            f'{PointEmoji.valorant} {bold(str(bundle.discount_price))} {strikethrough(str(bundle.price))} '
+            f'{italics(f"(Expires {format_relative(bundle.expires_at)})")}'
         )
     else:
-        embed.description = 'Bundle: {bundle}\n{emoji} {price}'.format(
-            bundle=bold(bundle.name_localizations.from_locale(str(locale)) + ' Collection'),
-            emoji=PointEmoji.valorant,
-            price=bundle.price,
-        )
+        embed.description = f'Bundle: {bundle_name}\n{PointEmoji.valorant} {bundle.price}'
 
     embeds.append(embed)
 
-    def item_priorities(i: Union[BundleItem, FeaturedBundleItem]) -> int:
-        if i.is_melee():
-            return 0
-        elif isinstance(i, SkinItem):
-            return 1
-        elif isinstance(i, BuddyItem):
-            return 2
-        elif isinstance(i, valorantx.PlayerCard):
-            return 3
-        elif isinstance(i, SprayItem):
-            return 4
-        # elif isinstance(i, valorantx.PlayerTitle):
-        #     return 5
-        else:
-            return 5
-
-    for item in sorted(bundle.items, key=item_priorities):
-        embeds.append(bundle_item_e(item, isinstance(bundle, valorantx.FeaturedBundle), locale=locale))
+    for item in sorted(bundle.items, key=_bundle_item_priority):
+        embeds.append(bundle_item_e(item, is_featured, locale=locale))
 
     return embeds
 
 
 class MatchEmbed:
+    __slots__ = (
+        '_match',
+        '_me',
+        '_is_deathmatch',
+        '_has_timeline',
+        '_is_competitive',
+        '_me_is_winner',
+        '_players_by_kills',
+        '_players_by_score',
+        '_me_team',
+        '_enemy_team',
+        '_me_team_players',
+        '_enemy_team_players',
+        '_opponents_sorted',
+        '_match_mvp',
+        '_team_mvp',
+        '_player_displays',
+        '_acs_displays',
+        '_hs_displays',
+        '_me_bold_display',
+        '_static_skeleton',
+        '_static_authors',
+        '_desktops',
+        '_mobiles',
+        '_cs_deathmatch_columns',
+        '_cs_deathmatch_score_fields',
+        '_cs_abilities_text',
+        '_cs_timeline_fields',
+    )
+
     def __init__(self, match: valorantx.MatchDetails):
         self._match = match
-        self._desktops: List[discord.Embed] = []
-        self._mobiles: List[discord.Embed] = []
-        self._build()
+        me = self._me = match.me
+        self._is_deathmatch = match.game_mode == GameModeType.deathmatch
+        self._has_timeline = match.game_mode.uuid not in NO_TIMELINE_MODES
+        self._is_competitive = match.queue == valorantx.QueueType.competitive
+        self._me_is_winner = me.is_winner()
+        self._players_by_kills: List[valorantx.models.match.MatchPlayer] = []
+        self._players_by_score: List[valorantx.models.match.MatchPlayer] = []
+        if self._is_deathmatch:
+            players = match.get_players()
+            if self._me_is_winner:
+                # the winner's title only needs the runner-up
+                self._players_by_kills = heapq.nlargest(2, players, key=_kills_key)
+            else:
+                self._players_by_kills = sorted(players, key=_kills_key, reverse=True)
+            self._players_by_score = sorted(players, key=_score_key, reverse=True)
+        self._me_team = match.get_me_team()
+        self._enemy_team = match.get_enemy_team()
+        self._me_team_players: Optional[List[valorantx.models.match.MatchPlayer]] = None
+        self._enemy_team_players: Optional[List[valorantx.models.match.MatchPlayer]] = None
+        self._opponents_sorted = sorted(me.opponents, key=_opponent_name_key)
+        self._match_mvp = match.get_match_mvp()
+        self._team_mvp = match.get_team_mvp()
+        # per-player strings keyed by puuid, shared by every page
+        self._player_displays: Dict[str, str] = {}
+        self._acs_displays: Dict[str, str] = {}
+        self._hs_displays: Dict[str, str] = {}
+        self._me_bold_display: Optional[str] = None
+        self._static_skeleton = self._build_static_skeleton()
+        # set_author's payload for the regular and performance pages, shared by every copy
+        self._static_authors: Dict[bool, Dict[str, Any]] = {}
+        for performance in (False, True):
+            page = match.game_mode.display_name if not performance else 'Performance'
+            author = {'name': f'{me.display_name} - {page}'}
+            if me.agent.display_icon_small is not None:
+                author['icon_url'] = str(me.agent.display_icon_small)
+            self._static_authors[performance] = author
+        self._desktops: Optional[List[discord.Embed]] = None
+        self._mobiles: Optional[List[discord.Embed]] = None
+
+    @property
+    def page_count(self) -> int:
+        # deathmatch has no FK/HS% page
+        return 2 if self._is_deathmatch else 3
 
     def get_desktop(self) -> List[discord.Embed]:
+        if self._desktops is None:
+            pages = [self.desktop_1()]
+            if not self._is_deathmatch:
+                pages.append(self.desktop_2())
+            pages.append(self.desktop_3())
+            self._desktops = pages
         return self._desktops
 
     def get_mobile(self) -> List[discord.Embed]:
+        if self._mobiles is None:
+            pages = [self.mobile_1()]
+            if not self._is_deathmatch:
+                pages.append(self.mobile_2())
+            pages.append(self.mobile_3())
+            self._mobiles = pages
         return self._mobiles
 
     @property
     def me(self) -> Optional[match.MatchPlayer]:
-        return self._match.me
+        return self._me
 
     @property
     def _map(self) -> valorantx.Map:
         return self._match.map
 
     def get_me_team(self) -> Any:  # TODO: fix this
-        return self._match.get_me_team()
+        return self._me_team
 
     def get_enemy_team(self) -> Any:  # TODO: fix this
-        return self._match.get_enemy_team()
+        return self._enemy_team
 
     def get_me_team_players(self) -> List[match.MatchPlayer]:
-        return sorted(self.get_me_team().get_players(), key=lambda p: p.acs, reverse=True)
+        if self._me_team_players is None:
+            self._me_team_players = sorted(self._me_team.get_players(), key=_acs_key, reverse=True)
+        return self._me_team_players
 
     def get_enemy_team_players(self) -> List[match.MatchPlayer]:
-        return sorted(self.get_enemy_team().get_players(), key=lambda p: p.acs, reverse=True)
+        if self._enemy_team_players is None:
+            self._enemy_team_players = sorted(self._enemy_team.get_players(), key=_acs_key, reverse=True)
+        return self._enemy_team_players
 
     def _get_mvp_star(self, player: match.MatchPlayer) -> str:
-        if player == self._match.get_match_mvp():
-            return '★'
-        elif player == self._match.get_team_mvp():
-            return '☆'
-        return ''
+        return '★' if player is self._match_mvp else ('☆' if player is self._team_mvp else '')
 
     def _tier_display(self, player: match.MatchPlayer) -> str:
+        if not self._is_competitive:
+            return ''
         tier = player.get_competitive_rank()
-        return (
-            (' ' + tier.emoji + ' ')  # type: ignore
-            if self._match.queue == valorantx.QueueType.competitive and tier is not None
-            else ''
-        )
+        return (' ' + tier.emoji + ' ') if tier is not None else ''  # type: ignore
 
     def _player_display(self, player: match.MatchPlayer, is_bold: bool = True) -> str:
-        return (
-            player.agent.emoji  # type: ignore
-            + self._tier_display(player)
-            + ' '
-            + (bold(player.display_name) if is_bold and player == self.me else player.display_name)
-        )
+        if is_bold and player is self._me:
+            if self._me_bold_display is None:
+                self._me_bold_display = (
+                    player.agent.emoji + self._tier_display(player) + ' ' + bold(player.display_name)  # type: ignore
+                )
+            return self._me_bold_display
+
+        display = self._player_displays.get(player.puuid)
+        if display is None:
+            display = player.agent.emoji + self._tier_display(player) + ' ' + player.display_name  # type: ignore
+            self._player_displays[player.puuid] = display
+        return display
 
     def _acs_display(self, player: match.MatchPlayer, star: bool = True) -> str:
-        acs = str(int(player.acs))
-        if star:
-            acs += ' ' + self._get_mvp_star(player)
+        if not star:
+            return str(int(player.acs))
+
+        acs = self._acs_displays.get(player.puuid)
+        if acs is None:
+            acs = self._acs_displays[player.puuid] = f'{int(player.acs)} {self._get_mvp_star(player)}'
         return acs
 
-    # @lru_cache(maxsize=2)
-    def static_embed(self, performance: bool = False) -> discord.Embed:
+    def _hs_display(self, player: match.MatchPlayer) -> str:
+        hs = self._hs_displays.get(player.puuid)
+        if hs is None:
+            hs = self._hs_displays[player.puuid] = f'{player.head_shot_percent:.1f}%'
+        return hs
+
+    def _team_columns(self, players: List[match.MatchPlayer], is_bold: bool = True) -> Tuple[str, str, str]:
+        names, acs, kda = [], [], []
+        player_display, acs_display = self._player_display, self._acs_display
+        for p in players:
+            names.append(player_display(p, is_bold=is_bold))
+            acs.append(acs_display(p))
+            kda.append(str(p.kda))
+        return '\n'.join(names), '\n'.join(acs), '\n'.join(kda)
+
+    def _team_fk_hs_columns(self, players: List[match.MatchPlayer], is_bold: bool = True) -> Tuple[str, str, str]:
+        names, fk, hs = [], [], []
+        player_display, hs_display = self._player_display, self._hs_display
+        for p in players:
+            names.append(player_display(p, is_bold=is_bold))
+            fk.append(str(p.first_kills))
+            hs.append(hs_display(p))
+        return '\n'.join(names), '\n'.join(fk), '\n'.join(hs)
+
+    @discord.utils.cached_slot_property('_cs_deathmatch_columns')
+    def _deathmatch_columns(self) -> Tuple[str, str, str]:
+        names, score, kda = [], [], []
+        player_display = self._player_display
+        for p in self._players_by_score:
+            names.append(player_display(p))
+            score.append(str(p.score))
+            kda.append(str(p.kda))
+        return '\n'.join(names), '\n'.join(score), '\n'.join(kda)
+
+    @discord.utils.cached_slot_property('_cs_deathmatch_score_fields')
+    def _deathmatch_score_fields(self) -> List[Tuple[str, str]]:
+        player_display = self._player_display
+        return [(player_display(p), f'SCORE: {p.score}\nKDA: {p.kda}') for p in self._players_by_score]
 
-        me_team = self.get_me_team()
-        enemy_team = self.get_enemy_team()
+    def static_embed(self, performance: bool = False) -> discord.Embed:
+        # pages add their own fields, so every page gets a fresh field list
+        e = copy.copy(self._static_skeleton)
+        e._fields = []
+        e._author = self._static_authors[performance]
+        return e
 
-        e = discord.Embed(
-            title='{mode} {map} - {won}:{lose}'.format(
-                mode=self._match.game_mode.emoji,  # type: ignore
-                map=self._map.display_name,
-                won=me_team.rounds_won if me_team is not None else 0,
-                lose=enemy_team.rounds_won if enemy_team is not None else 0,
-            ),
-            timestamp=self._match.started_at,
-            colour=ResultColor.win,
-        )
+    def _build_static_skeleton(self) -> discord.Embed:
 
-        if self._match.game_mode == GameModeType.deathmatch:
-            players = self._match.get_players()
+        if self._is_deathmatch:
+            players = self._players_by_kills
 
-            if self.me.is_winner():
-                _2nd_place = (sorted(players, key=lambda p: p.kills, reverse=True)[1]) if len(players) > 1 else None
+            if self._me_is_winner:
+                _2nd_place = players[1] if len(players) > 1 else None
                 _1st_place = self.me
             else:
                 _2nd_place = self.me
-                _1st_place = (sorted(players, key=lambda p: p.kills, reverse=True)[0]) if len(players) > 0 else None
+                _1st_place = players[0] if len(players) > 0 else None
 
-            e.title = '{mode} {map} - {won}:{lose}'.format(
-                mode=self._match.game_mode.emoji,  # type: ignore
-                map=self._map.display_name,
-                won=(_1st_place.kills if self.me.is_winner() else _2nd_place.kills) if _1st_place else 0,
-                lose=(_2nd_place.kills if self.me.is_winner() else _1st_place.kills) if _2nd_place else 0,
-            )
+            won = (_1st_place.kills if self._me_is_winner else _2nd_place.kills) if _1st_place else 0
+            lose = (_2nd_place.kills if self._me_is_winner else _1st_place.kills) if _2nd_place else 0
+        else:
+            me_team = self._me_team
+            enemy_team = self._enemy_team
+            won = me_team.rounds_won if me_team is not None else 0
+            lose = enemy_team.rounds_won if enemy_team is not None else 0
 
-        e.set_author(
-            name='{author} - {page}'.format(
-                author=self.me.display_name,
-                page=(self._match.game_mode.display_name if not performance else 'Performance'),
-            ),
-            icon_url=self.me.agent.display_icon_small,
+        e = discord.Embed(
+            title=f'{self._match.game_mode.emoji} {self._map.display_name} - {won}:{lose}',  # type: ignore
+            timestamp=self._match.started_at,
+            colour=ResultColor.win,
         )
 
         result = 'VICTORY'
 
-        if self._match.game_mode == GameModeType.deathmatch:
-            if self.me.is_winner():
+        if self._is_deathmatch:
+            if self._me_is_winner:
                 result = '1ST PLACE'
             else:
-                players = sorted(self._match.get_players(), key=lambda p: p.kills, reverse=True)
-                for index, player in enumerate(players, start=1):
-                    player_before = players[index - 1]
-                    player_after = players[index] if len(players) > index else None
-                    if player == self.me:
-                        if index == 2:
-                            result = '2ND PLACE'
-                        elif index == 3:
-                            result = '3RD PLACE'
-                        else:
-                            result = '{}TH PLACE'.format(index)
-
-                        if player_before is not None or player_after is not None:
-                            if player_before.kills == player.kills:
-                                result += ' (TIED)'
-                            elif player_after.kills == player.kills:
-                                result += ' (TIED)'
-
-        elif not self.me.is_winner():
+                result = deathmatch_placement(self._players_by_kills, self.me) or result
+
+        elif not self._me_is_winner:
             e.colour = ResultColor.lose
             result = 'DEFEAT'
 
@@ -611,18 +760,42 @@ class MatchEmbed:
 
         return e
 
-    def __abilities_text(self, abilities: match.AbilityCasts) -> str:
-        return '{c_emoji} {c_casts} {q_emoji} {q_casts} {e_emoji} {e_casts} {x_emoji} {x_casts}'.format(
-            c_emoji=abilities.c.emoji,  # type: ignore
-            c_casts=round(abilities.c_casts / self.me.rounds_played, 1),
-            e_emoji=abilities.e.emoji,  # type: ignore
-            e_casts=round(abilities.e_casts / self.me.rounds_played, 1),
-            q_emoji=abilities.q.emoji,  # type: ignore
-            q_casts=round(abilities.q_casts / self.me.rounds_played, 1),
-            x_emoji=abilities.x.emoji,  # type: ignore
-            x_casts=round(abilities.x_casts / self.me.rounds_played, 1),
+    @discord.utils.cached_slot_property('_cs_abilities_text')
+    def _abilities_text(self) -> Optional[str]:
+        abilities = self._me.ability_casts
+        if abilities is None:
+            return None
+        rounds = self.me.rounds_played or 1
+        return (
+            f'{abilities.c.emoji} {round(abilities.c_casts / rounds, 1)} '  # type: ignore
+            f'{abilities.q.emoji} {round(abilities.q_casts / rounds, 1)} '  # type: ignore
+            f'{abilities.e.emoji} {round(abilities.e_casts / rounds, 1)} '  # type: ignore
+            f'{abilities.x.emoji} {round(abilities.x_casts / rounds, 1)}'  # type: ignore
         )
 
+    @discord.utils.cached_slot_property('_cs_timeline_fields')
+    def _timeline_fields(self) -> List[Tuple[str, str]]:
+        if not self._has_timeline:
+            return []
+
+        regular, overtime = [], []
+        surrendered = valorantx.RoundResultCode.surrendered
+
+        for i, r in enumerate(self._match.round_results, start=1):
+
+            if i == 12:
+                regular.append(' | ')
+
+            # rounds past the regulation 24 go to overtime
+            (regular if i <= 24 else overtime).append(r.emoji)  # type: ignore
+
+            if r.result_code == surrendered:
+                break
+
+        if overtime:
+            return [('Timeline:', ''.join(regular)), ('Overtime:', ''.join(overtime))]
+        return [('Timeline:', ''.join(regular))]
+
     # desktop section
     def desktop_1(self) -> discord.Embed:
 
@@ -631,58 +804,19 @@ class MatchEmbed:
         mt_players = self.get_me_team_players()
         et_players = self.get_enemy_team_players()
 
-        if self._match.game_mode != GameModeType.deathmatch:
+        if not self._is_deathmatch:
             # MY TEAM
-            e.add_field(
-                name='MY TEAM',
-                value='\n'.join([self._player_display(p) for p in mt_players]),
-            )
-            e.add_field(
-                name='ACS',
-                value="\n".join([self._acs_display(p) for p in mt_players]),
-            )
-            e.add_field(name='KDA', value="\n".join([str(p.kda) for p in mt_players]))
+            names, acs, kda = self._team_columns(mt_players)
+            _extend_fields(e, (('MY TEAM', names), ('ACS', acs), ('KDA', kda)))
 
             # ENEMY TEAM
-            e.add_field(
-                name='ENEMY TEAM',
-                value='\n'.join([self._player_display(p, is_bold=False) for p in et_players]),  # type: ignore
-            )
-            e.add_field(
-                name='ACS',
-                value="\n".join([self._acs_display(p) for p in et_players]),
-            )
-            e.add_field(name='KDA', value="\n".join([str(p.kda) for p in et_players]))
+            names, acs, kda = self._team_columns(et_players, is_bold=False)
+            _extend_fields(e, (('ENEMY TEAM', names), ('ACS', acs), ('KDA', kda)))
         else:
-            players = sorted(self._match.get_players(), key=lambda p: p.score, reverse=True)
-            e.add_field(
-                name='Players',
-                value='\n'.join([self._player_display(p) for p in players]),
-            )
-            e.add_field(name='SCORE', value='\n'.join([f'{p.score}' for p in players]))
-            e.add_field(name='KDA', value='\n'.join([f'{p.kda}' for p in players]))
-
-        timelines = []
+            names, score, kda = self._deathmatch_columns
+            _extend_fields(e, (('Players', names), ('SCORE', score), ('KDA', kda)))
 
-        for i, r in enumerate(self._match.round_results, start=1):
-
-            if i == 12:
-                timelines.append(' | ')
-
-            if r.winning_team() == self.get_me_team():
-                timelines.append(r.emoji)  # type: ignore
-            else:
-                timelines.append(r.emoji)  # type: ignore
-
-            if r.result_code == valorantx.RoundResultCode.surrendered:
-                break
-
-        if self._match.game_mode.uuid not in [str(GameModeType.escalation), str(GameModeType.deathmatch)]:
-            if len(timelines) > 25:
-                e.add_field(name='Timeline:', value=''.join(timelines[:25]), inline=False)
-                e.add_field(name='Overtime:', value=''.join(timelines[25:]), inline=False)
-            else:
-                e.add_field(name='Timeline:', value=''.join(timelines), inline=False)
+        _extend_fields(e, self._timeline_fields, inline=False)
 
         return e
 
@@ -694,57 +828,29 @@ class MatchEmbed:
         et_players = self.get_enemy_team_players()
 
         # MY TEAM
-        e.add_field(
-            name='MY TEAM',
-            value='\n'.join([self._player_display(p) for p in mt_players]),
-        )
-        e.add_field(name='FK', value="\n".join([str(p.first_kills) for p in mt_players]))
-        e.add_field(
-            name='HS%',
-            value='\n'.join([(str(round(p.head_shot_percent, 1)) + '%') for p in mt_players]),
-        )
+        names, fk, hs = self._team_fk_hs_columns(mt_players)
+        _extend_fields(e, (('MY TEAM', names), ('FK', fk), ('HS%', hs)))
 
         # ENEMY TEAM
-        e.add_field(
-            name='ENEMY TEAM',
-            value='\n'.join([self._player_display(p, is_bold=False) for p in et_players]),  # type: ignore
-        )
-        e.add_field(name='FK', value='\n'.join([str(p.first_kills) for p in et_players]))
-        e.add_field(
-            name='HS%',
-            value='\n'.join([(str(round(p.head_shot_percent, 1)) + '%') for p in et_players]),
-        )
+        names, fk, hs = self._team_fk_hs_columns(et_players, is_bold=False)
+        _extend_fields(e, (('ENEMY TEAM', names), ('FK', fk), ('HS%', hs)))
 
         return e
 
     def desktop_3(self) -> discord.Embed:
         e = self.static_embed(performance=True)
-        e.add_field(
-            name='KDA',
-            value='\n'.join(
-                [
-                    p.kda
-                    for p in sorted(
-                        self._match.me.opponents,
-                        key=lambda p: p.opponent.display_name.lower(),
-                    )
-                ]
-            ),
-        )
-        e.add_field(
-            name='Opponent',
-            value='\n'.join(
-                self._player_display(p.opponent)
-                for p in sorted(
-                    self._match.me.opponents,
-                    key=lambda p: p.opponent.display_name.lower(),
-                )
-            ),
-        )
 
-        abilities = self._match.me.ability_casts
-        if abilities is not None:
-            text = self.__abilities_text(abilities)
+        kda, opponents = [], []
+        player_display = self._player_display
+        for p in self._opponents_sorted:
+            kda.append(p.kda)
+            opponents.append(player_display(p.opponent))
+
+        e.add_field(name='KDA', value='\n'.join(kda))
+        e.add_field(name='Opponent', value='\n'.join(opponents))
+
+        text = self._abilities_text
+        if text is not None:
             e.add_field(name='Abilities', value=text, inline=False)
 
         return e
@@ -753,128 +859,79 @@ class MatchEmbed:
     def mobile_1(self) -> discord.Embed:
 
         e = self.static_embed()
+        player_display, acs_display = self._player_display, self._acs_display
 
-        if self._match.game_mode != GameModeType.deathmatch:
+        if not self._is_deathmatch:
 
             # MY TEAM
             e.add_field(name='\u200b', value=bold('MY TEAM'), inline=False)
-            for player in self.get_me_team_players():
-                e.add_field(
-                    name=self._player_display(player),
-                    value=f'ACS: {self._acs_display(player)}\nKDA: {player.kda}',
-                    inline=True,
-                )
+            _extend_fields(
+                e,
+                [(player_display(p), f'ACS: {acs_display(p)}\nKDA: {p.kda}') for p in self.get_me_team_players()],
+            )
 
             # ENEMY TEAM
             e.add_field(name='\u200b', value=bold('ENEMY TEAM'), inline=False)
-            for player in self.get_enemy_team_players():
-                e.add_field(
-                    name=self._player_display(player),  # type: ignore
-                    value=f'ACS: {self._acs_display(player)}\nKDA: {player.kda}',
-                    inline=True,
-                )
+            _extend_fields(
+                e,
+                [(player_display(p), f'ACS: {acs_display(p)}\nKDA: {p.kda}') for p in self.get_enemy_team_players()],
+            )
         else:
-            players = sorted(self._match.get_players(), key=lambda p: p.score, reverse=True)
-            for player in players:
-                e.add_field(
-                    name=self._player_display(player),  # type: ignore
-                    value=f'SCORE: {player.score}\nKDA: {player.kda}',
-                    inline=True,
-                )
-
-        timelines = []
-
-        for i, r in enumerate(self._match.round_results, start=1):
-
-            # if r.result_code == valorantx.RoundResultCode.surrendered:
-            #     timelines.append('Surrendered')
-            #     break
+            _extend_fields(e, self._deathmatch_score_fields)
 
-            if i == 12:
-                timelines.append(' | ')
-
-            if r.winning_team() == self.get_me_team():
-                timelines.append(r.emoji)  # type: ignore
-            else:
-                timelines.append(r.emoji)  # type: ignore
-
-        if self._match.game_mode.uuid not in [str(GameModeType.escalation), str(GameModeType.deathmatch)]:
-            if len(timelines) > 25:
-                e.add_field(name='Timeline:', value=''.join(timelines[:25]), inline=False)
-                e.add_field(name='Overtime:', value=''.join(timelines[25:]), inline=False)
-            else:
-                e.add_field(name='Timeline:', value=''.join(timelines), inline=False)
+        _extend_fields(e, self._timeline_fields, inline=False)
 
         return e
 
     def mobile_2(self) -> discord.Embed:
 
         e = self.static_embed()
+        player_display, hs_display = self._player_display, self._hs_display
 
         # MY TEAM
         e.add_field(name='\u200b', value=bold('MY TEAM'))
-        for player in self.get_me_team_players():
-            e.add_field(
-                name=self._player_display(player),  # type: ignore
-                value=f'FK: {player.first_kills}\nHS%: {round(player.head_shot_percent, 1)}%',
-                inline=True,
-            )
+        _extend_fields(
+            e,
+            [(player_display(p), f'FK: {p.first_kills}\nHS%: {hs_display(p)}') for p in self.get_me_team_players()],
+        )
 
         # ENEMY TEAM
         e.add_field(name='\u200b', value=bold('ENEMY TEAM'), inline=False)
-        for player in self.get_enemy_team_players():
-            e.add_field(
-                name=self._player_display(player, is_bold=False),
-                value=f'FK: {player.first_kills}\nHS%: {round(player.head_shot_percent, 1)}%',
-                inline=True,
-            )
+        _extend_fields(
+            e,
+            [
+                (player_display(p, is_bold=False), f'FK: {p.first_kills}\nHS%: {hs_display(p)}')
+                for p in self.get_enemy_team_players()
+            ],
+        )
 
         return e
 
     def mobile_3(self) -> discord.Embed:
         e = self.static_embed(performance=True)
+        player_display = self._player_display
         e.add_field(
             name='KDA Opponent',
-            value='\n'.join(
-                [(p.kda + ' ' + self._player_display(p.opponent)) for p in self._match.me.opponents]
-            ),  # type: ignore
+            value='\n'.join([(p.kda + ' ' + player_display(p.opponent)) for p in self._me.opponents]),
         )
 
-        abilities = self._match.me.ability_casts
-        if abilities is not None:
-            text = self.__abilities_text(abilities)
+        text = self._abilities_text
+        if text is not None:
             e.add_field(name='Abilities', value=text, inline=False)
 
         return e
 
     def death_match_desktop(self) -> discord.Embed:
-        players = sorted(self._match.get_players(), key=lambda p: p.score, reverse=True)
+        names, score, kda = self._deathmatch_columns
         e = discord.Embed()
-        e.set_author(name=self._match.game_mode.display_name, icon_url=self._match.me.agent.display_icon)
-        e.add_field(
-            name='Players',
-            value='\n'.join([self._player_display(p) for p in players]),
-        )
-        e.add_field(name='SCORE', value='\n'.join([f'{p.score}' for p in players]))
-        e.add_field(name='KDA', value='\n'.join([f'{p.kda}' for p in players]))
+        e.set_author(name=self._match.game_mode.display_name, icon_url=self._me.agent.display_icon)
+        e.add_field(name='Players', value=names)
+        e.add_field(name='SCORE', value=score)
+        e.add_field(name='KDA', value=kda)
         return e
 
     def death_match_mobile(self) -> discord.Embed:
-        players = sorted(self._match.get_players(), key=lambda p: p.score, reverse=True)
         e = discord.Embed()
-        e.set_author(name=self._match.game_mode.display_name, icon_url=self._match.me.agent.display_icon)
-        for player in players:
-            e.add_field(
-                name=self._player_display(player),  # type: ignore
-                value=f'SCORE: {player.score}\nKDA: {player.kda}',
-                inline=True,
-            )
+        e.set_author(name=self._match.game_mode.display_name, icon_url=self._me.agent.display_icon)
+        _extend_fields(e, self._deathmatch_score_fields)
         return e
-
-    def _build(self) -> None:
-        if self._match.game_mode == GameModeType.deathmatch:
-            self._desktops = [self.desktop_1(), self.desktop_3()]
-            self._mobiles = [self.mobile_1(), self.mobile_3()]
-        else:
-            self._desktops = [self.desktop_1(), self.desktop_2(), self.desktop_3()]
-            self._mobiles = [self.mobile_1(), self.mobile_2(), self.mobile_3()]
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from enum import Enum, IntEnum
-from typing import TYPE_CHECKING, Optional, Union
+from typing import TYPE_CHECKING, Dict, Optional, Union
 
 import valorantx
 
@@ -34,12 +34,23 @@ class AgentEmoji(str, Enum):
     yoru = '<:agent_yoru:1042813595710410833>'
 
     def __str__(self) -> str:
-        return str(self.value)
+        return self._value_
 
     @classmethod
     def get(cls, agent: Union[valorantx.Agent, str]) -> str:
         display_name = agent.display_name if isinstance(agent, valorantx.Agent) else agent
-        return cls.__members__.get(display_name.lower().replace("/", "_").replace(" ", "_"), '')
+        emoji = _AGENT_EMOJIS_BY_NAME.get(display_name)
+        if emoji is None:
+            key = display_name.translate(_AGENT_KEY_TABLE).lower()
+            emoji = _AGENT_EMOJIS_BY_NAME[display_name] = _AGENT_EMOJIS.get(key, '')
+        return emoji
+
+
+# Enum.__members__ builds a new mappingproxy on every access
+_AGENT_EMOJIS: Dict[str, AgentEmoji] = dict(AgentEmoji.__members__)
+_AGENT_KEY_TABLE = str.maketrans({'/': '_', ' ': '_'})
+# display name -> emoji, rosters repeat the same handful of agents
+_AGENT_EMOJIS_BY_NAME: Dict[str, str] = {}
 
 
 class AbilitiesEmoji(str, Enum):
@@ -127,7 +138,7 @@ class AbilitiesEmoji(str, Enum):
     yoru_gatecrash = '<:yoru_gatecrash:1042933414841565205>'
 
     def __str__(self) -> str:
-        return str(self.value)
+        return self._value_
 
     @classmethod
     def get(cls, name: str) -> str:
@@ -145,7 +156,7 @@ class GameModeEmoji(str, Enum):
     snowball_fight = '<:gamemode_snowball_fight:1042834176606486558>'
 
     def __str__(self) -> str:
-        return str(self.value)
+        return self._value_
 
     @classmethod
     def get(cls, name: str) -> str:
@@ -162,7 +173,7 @@ class ContentTierEmoji(str, Enum):
     ultra = '<:new_content_tier_ultra:1083077703638458400>'
 
     def __str__(self) -> str:
-        return str(self.value)
+        return self._value_
 
     @classmethod
     def get(cls, content_tier: Union[valorantx.ContentTier, str]) -> str:
@@ -184,7 +195,7 @@ class RoundResultEmoji(str, Enum):
     detonate_win = explosion_win
 
     def __str__(self) -> str:
-        return str(self.value)
+        return self._value_
 
     @classmethod
     def get(cls, name: str, is_win: Optional[bool] = None) -> str:
@@ -227,7 +238,7 @@ class TierEmoji(str, Enum):
     unranked = '<:tier_unranked:1043966640674574366>'
 
     def __str__(self) -> str:
-        return str(self.value)
+        return self._value_
 
     @classmethod
     def get(cls, tier: Union[valorantx.Tier, str]) -> str:
@@ -242,7 +253,7 @@ class PointEmoji(Enum):
     free_agent = '<:currency_free_agents:1042817043965165580>'
 
     def __str__(self) -> str:
-        return str(self.value)
+        return self._value_
 
     @classmethod
     def get(cls, name: str) -> str:
@@ -275,12 +286,17 @@ class ValorantLocale(Enum):
     id = 'id-ID'
 
     def __str__(self) -> str:
-        return str(self.value)
+        return self._value_
 
     @classmethod
     def from_discord(cls, value: str) -> Self:
-        value = value.replace('-', '_')
-        locale = getattr(cls, value, None)
+        value = value.translate(_DASH_TABLE)
+        locale = _VALORANT_LOCALES.get(value)
         if locale is None:
             raise ValueError(f'Invalid locale: {value}')
-        return locale
+        return locale  # type: ignore
+
+
+_DASH_TABLE = str.maketrans('-', '_')
+# built from __members__ so aliases such as en_GB are kept
+_VALORANT_LOCALES: Dict[str, ValorantLocale] = dict(ValorantLocale.__members__)
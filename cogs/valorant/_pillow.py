@@ -2,20 +2,35 @@ from __future__ import annotations
 
 import asyncio
 import enum
+import functools
 from io import BytesIO
-from typing import TYPE_CHECKING, Optional, Union
+from typing import TYPE_CHECKING, Final, List, Optional, Tuple, Union
 
-import chardet
 import discord
 from PIL import Image, ImageDraw, ImageFilter, ImageFont
 from valorantx import Collection, SkinChromaLoadout, SkinLevelLoadout, SkinLoadout
 
+from utils.cache import LRUCache
 from utils.useful import LatteFonts, LatteImages
 
 if TYPE_CHECKING:
     SkinL = Union[SkinLoadout, SkinLevelLoadout, SkinChromaLoadout]
 
 
+@functools.lru_cache(maxsize=32)
+def _font(path: str, size: int) -> ImageFont.FreeTypeFont:
+    # truetype parses the font file on every call
+    return ImageFont.truetype(font=path, size=size)
+
+
+@functools.lru_cache(maxsize=1)
+def _card_fade(width: int, height: int) -> Image.Image:
+    # bottom fade of the player card, rows 203 and below
+    column = Image.new('L', (1, height - 203))
+    column.putdata([max(0, min(255, 255 - int((y - height * 0.55) / height / 0.35 * 255))) for y in range(203, height)])
+    return column.resize((width, height - 203), Image.NEAREST)
+
+
 class Colors(enum.Enum):
     username = "#252627"
     tagline = "#64666a"
@@ -39,10 +54,10 @@ class StatusColor(enum.Enum):
 async def profile_card(loadout: Collection) -> discord.File:
 
     # ascii font
-    font_username = ImageFont.truetype(font=str(LatteFonts.dinnextw1g_bold), size=19)
-    font_tagline = ImageFont.truetype(font=str(LatteFonts.dinnextw1g_regular), size=13)
-    font_rank = ImageFont.truetype(font=str(LatteFonts.beni_bold), size=36)
-    font_title = ImageFont.truetype(font=str(LatteFonts.dinnextw1g_regular), size=13)
+    font_username = _font(str(LatteFonts.dinnextw1g_bold), 19)
+    font_tagline = _font(str(LatteFonts.dinnextw1g_regular), 13)
+    font_rank = _font(str(LatteFonts.beni_bold), 36)
+    font_title = _font(str(LatteFonts.dinnextw1g_regular), 13)
 
     # open image
     background = Image.open(str(LatteImages.profile_card_available_2))
@@ -52,10 +67,10 @@ async def profile_card(loadout: Collection) -> discord.File:
     # rank_icon = Image.open(BytesIO(r.content)).convert('RGBA')
 
     tasks = [
-        asyncio.ensure_future(loadout.identity.player_card.small_icon.read()),
-        asyncio.ensure_future(loadout.identity.level_border.small_player_card_appearance.read()),
-        asyncio.ensure_future(loadout.identity.level_border.level_number_appearance.read()),
-        # asyncio.ensure_future(loadout.user.rank),
+        loadout.identity.player_card.small_icon.read(),
+        loadout.identity.level_border.small_player_card_appearance.read(),
+        loadout.identity.level_border.level_number_appearance.read(),
+        # loadout.user.rank,
     ]
 
     card = None
@@ -66,7 +81,7 @@ async def profile_card(loadout: Collection) -> discord.File:
     reads_task = await asyncio.gather(*tasks)
     for index, read in enumerate(reads_task):
         if index == 0:
-            card = Image.open(BytesIO(read)).resize((62, 62), Image.ANTIALIAS).convert('RGBA')
+            card = Image.open(BytesIO(read)).resize((62, 62), Image.Resampling.BILINEAR).convert('RGBA')
         elif index == 1:
             level_border = Image.open(BytesIO(read)).convert('RGBA')
         elif index == 2:
@@ -84,13 +99,13 @@ async def profile_card(loadout: Collection) -> discord.File:
     # tagline position
     tagline_y = 44
 
-    # username detection utf-8
-    if chardet.detect(loadout.user.name.encode('utf-8'))['encoding'] == 'utf-8':
-        font_username = ImageFont.truetype(font=str(LatteFonts.serif_712), size=30)
+    # non-ascii username
+    if not loadout.user.name.isascii():
+        font_username = _font(str(LatteFonts.serif_712), 30)
 
-    # tagline detection utf-8
-    if chardet.detect(loadout.user.tagline.encode('utf-8'))['encoding'] == 'utf-8':
-        font_tagline = ImageFont.truetype(font=str(LatteFonts.serif_712), size=20)
+    # non-ascii tagline
+    if not loadout.user.tagline.isascii():
+        font_tagline = _font(str(LatteFonts.serif_712), 20)
         tagline_y += 1
 
     # username
@@ -126,6 +141,61 @@ async def profile_card(loadout: Collection) -> discord.File:
     return discord.File(fp=buffer, filename='profile.png')
 
 
+# weapon, width divisor, height divisor, position on the collection background
+COLLECTION_SKINS: Final[Tuple[Tuple[str, float, float, Tuple[int, int]], ...]] = (
+    ('classic', 3.55, 3.55, (389, 191)),
+    ('shorty', 3.32, 3.25, (385, 388)),
+    ('frenzy', 3.45, 3.4, (388, 529)),
+    ('ghost', 3.12, 3.12, (379, 725)),
+    ('sheriff', 3.12, 3.1, (379, 882)),
+    ('stinger', 2.09, 2.09, (632, 195)),
+    ('spectre', 1.96, 1.97, (625, 367)),
+    ('bucky', 1.69, 1.71, (605, 552)),
+    ('judge', 1.66, 1.67, (602, 708)),
+    ('bulldog', 1.75, 1.75, (984, 199)),
+    ('guardian', 1.75, 1.74, (984, 380)),
+    ('phantom', 1.75, 1.75, (984, 547)),
+    ('vandal', 1.75, 1.76, (984, 709)),
+    ('marshal', 1.37, 1.37, (1352, 205)),
+    ('operator', 1.37, 1.36, (1353, 372)),
+    ('ares', 1.37, 1.5, (1353, 545)),
+    ('odin', 1.37, 1.37, (1353, 708)),
+)
+SPRAY_POSITIONS: Final[Tuple[Tuple[int, int], ...]] = ((190, 691), (190, 797), (190, 903))
+
+
+# resized weapon skins keyed by (icon url, weapon), default and popular skins are shared across players
+_SKIN_IMAGES: LRUCache[Tuple[str, str], Image.Image] = LRUCache(maxsize=512)
+
+
+def _open_rgba(data: bytes) -> Image.Image:
+    return Image.open(BytesIO(data)).convert('RGBA')
+
+
+def _decode_collection(
+    layouts: List[Tuple[str, float, float, Tuple[int, int]]],
+    images: List[bytes],
+) -> Tuple[List[Image.Image], Image.Image, List[Image.Image], Image.Image, Image.Image]:
+    # decoding and resizing blocks, so this runs in a worker thread
+    skins = []
+    for data, (_, width_ratio, height_ratio, _) in zip(images, layouts):
+        skin = _open_rgba(data)
+        skins.append(
+            skin.resize((int(skin.size[0] / width_ratio), int(skin.size[1] / height_ratio)), Image.Resampling.LANCZOS)
+        )
+
+    melee_data, *spray_data, level_border_data, player_card_data = images[len(layouts) :]
+    sprays = [_open_rgba(data).resize((78, 78), Image.Resampling.BILINEAR) for data in spray_data]
+    level_border = _open_rgba(level_border_data).resize((61, 25), Image.Resampling.BILINEAR)
+
+    # blur
+    player_card = _open_rgba(player_card_data)
+    box = (0, 410, 268, 473)
+    player_card.paste(player_card.crop(box).filter(ImageFilter.GaussianBlur(radius=2)), box)
+
+    return skins, _open_rgba(melee_data), sprays, level_border, player_card
+
+
 async def player_collection(loadout: Collection) -> discord.File:  # TODO: Object
 
     # local assets
@@ -134,9 +204,9 @@ async def player_collection(loadout: Collection) -> discord.File:  # TODO: Objec
 
     # font
     font_path = str(LatteFonts.dinnextw1g_regular)
-    font_title = ImageFont.truetype(font=font_path, size=12)
-    font_level = ImageFont.truetype(font=font_path, size=13)
-    font_display_name = ImageFont.truetype(font=font_path, size=17)
+    font_title = _font(font_path, 12)
+    font_level = _font(font_path, 13)
+    font_display_name = _font(font_path, 17)
 
     # player loadout
     skins = loadout.skins
@@ -144,126 +214,32 @@ async def player_collection(loadout: Collection) -> discord.File:  # TODO: Objec
     # TODO: ถ้ามีไฟล์ในเครื่องไม่ต้อง add เข้าไปใน task
 
     # this way to fasten the process
-    tasks = [
-        asyncio.ensure_future(skins.classic.display_icon.read()),
-        asyncio.ensure_future(skins.shorty.display_icon.read()),
-        asyncio.ensure_future(skins.frenzy.display_icon.read()),
-        asyncio.ensure_future(skins.ghost.display_icon.read()),
-        asyncio.ensure_future(skins.sheriff.display_icon.read()),
-        asyncio.ensure_future(skins.stinger.display_icon.read()),
-        asyncio.ensure_future(skins.spectre.display_icon.read()),
-        asyncio.ensure_future(skins.bucky.display_icon.read()),
-        asyncio.ensure_future(skins.judge.display_icon.read()),
-        asyncio.ensure_future(skins.bulldog.display_icon.read()),
-        asyncio.ensure_future(skins.guardian.display_icon.read()),
-        asyncio.ensure_future(skins.phantom.display_icon.read()),
-        asyncio.ensure_future(skins.vandal.display_icon.read()),
-        asyncio.ensure_future(skins.marshal.display_icon.read()),
-        asyncio.ensure_future(skins.operator.display_icon.read()),
-        asyncio.ensure_future(skins.ares.display_icon.read()),
-        asyncio.ensure_future(skins.odin.display_icon.read()),
-        asyncio.ensure_future(skins.melee.display_icon.read()),
-        asyncio.ensure_future(loadout.sprays.slot_1.display_icon.read()),
-        asyncio.ensure_future(loadout.sprays.slot_2.display_icon.read()),
-        asyncio.ensure_future(loadout.sprays.slot_3.display_icon.read()),
-        asyncio.ensure_future(loadout.identity.level_border.level_number_appearance.read()),
-        asyncio.ensure_future(loadout.identity.player_card.large_icon.read()),
+    icons = [getattr(skins, name).display_icon for name, *_ in COLLECTION_SKINS]
+    skin_keys = [(icon.url, name) for icon, (name, *_) in zip(icons, COLLECTION_SKINS)]
+    skin_images = [_SKIN_IMAGES.get(key) for key in skin_keys]
+    missing = [index for index, image in enumerate(skin_images) if image is None]
+
+    tasks = [icons[index].read() for index in missing]
+    tasks += [
+        skins.melee.display_icon.read(),
+        loadout.sprays.slot_1.display_icon.read(),
+        loadout.sprays.slot_2.display_icon.read(),
+        loadout.sprays.slot_3.display_icon.read(),
+        loadout.identity.level_border.level_number_appearance.read(),
+        loadout.identity.player_card.large_icon.read(),
     ]
 
-    skin_tasks = await asyncio.gather(*tasks)
-    for index, image in enumerate(skin_tasks):
-        if index == 0:
-            classic = Image.open(BytesIO(image)).convert('RGBA')
-            classic = classic.resize((int(classic.size[0] / 3.55), int(classic.size[1] / 3.55)), Image.ANTIALIAS)
-        elif index == 1:
-            shorty = Image.open(BytesIO(image)).convert('RGBA')
-            shorty = shorty.resize((int(shorty.size[0] / 3.32), int(shorty.size[1] / 3.25)), Image.ANTIALIAS)
-        elif index == 2:
-            frenzy = Image.open(BytesIO(image)).convert('RGBA')
-            frenzy = frenzy.resize((int(frenzy.size[0] / 3.45), int(frenzy.size[1] / 3.4)), Image.ANTIALIAS)
-        elif index == 3:
-            ghost = Image.open(BytesIO(image)).convert('RGBA')
-            ghost = ghost.resize((int(ghost.size[0] / 3.12), int(ghost.size[1] / 3.12)), Image.ANTIALIAS)
-        elif index == 4:
-            sheriff = Image.open(BytesIO(image)).convert('RGBA')
-            sheriff = sheriff.resize((int(sheriff.size[0] / 3.12), int(sheriff.size[1] / 3.1)), Image.ANTIALIAS)
-        elif index == 5:
-            stinger = Image.open(BytesIO(image)).convert('RGBA')
-            stinger = stinger.resize((int(stinger.size[0] / 2.09), int(stinger.size[1] / 2.09)), Image.ANTIALIAS)
-        elif index == 6:
-            spectre = Image.open(BytesIO(image)).convert('RGBA')
-            spectre = spectre.resize((int(spectre.size[0] / 1.96), int(spectre.size[1] / 1.97)), Image.ANTIALIAS)
-        elif index == 7:
-            bucky = Image.open(BytesIO(image)).convert('RGBA')
-            bucky = bucky.resize((int(bucky.size[0] / 1.69), int(bucky.size[1] / 1.71)), Image.ANTIALIAS)
-        elif index == 8:
-            judge = Image.open(BytesIO(image)).convert('RGBA')
-            judge = judge.resize((int(judge.size[0] / 1.66), int(judge.size[1] / 1.67)), Image.ANTIALIAS)
-        elif index == 9:
-            bulldog = Image.open(BytesIO(image)).convert('RGBA')
-            bulldog = bulldog.resize((int(bulldog.size[0] / 1.75), int(bulldog.size[1] / 1.75)), Image.ANTIALIAS)
-        elif index == 10:
-            guardian = Image.open(BytesIO(image)).convert('RGBA')
-            guardian = guardian.resize((int(guardian.size[0] / 1.75), int(guardian.size[1] / 1.74)), Image.ANTIALIAS)
-        elif index == 11:
-            phantom = Image.open(BytesIO(image)).convert('RGBA')
-            phantom = phantom.resize((int(phantom.size[0] / 1.75), int(phantom.size[1] / 1.75)), Image.ANTIALIAS)
-        elif index == 12:
-            vandal = Image.open(BytesIO(image)).convert('RGBA')
-            vandal = vandal.resize((int(vandal.size[0] / 1.75), int(vandal.size[1] / 1.76)), Image.ANTIALIAS)
-        elif index == 13:
-            marshal = Image.open(BytesIO(image)).convert('RGBA')
-            marshal = marshal.resize((int(marshal.size[0] / 1.37), int(marshal.size[1] / 1.37)), Image.ANTIALIAS)
-        elif index == 14:
-            operator = Image.open(BytesIO(image)).convert('RGBA')
-            operator = operator.resize((int(operator.size[0] / 1.37), int(operator.size[1] / 1.36)), Image.ANTIALIAS)
-        elif index == 15:
-            ares = Image.open(BytesIO(image)).convert('RGBA')
-            ares = ares.resize((int(ares.size[0] / 1.37), int(ares.size[1] / 1.5)), Image.ANTIALIAS)
-        elif index == 16:
-            odin = Image.open(BytesIO(image)).convert('RGBA')
-            odin = odin.resize((int(odin.size[0] / 1.37), int(odin.size[1] / 1.37)), Image.ANTIALIAS)
-        elif index == 17:
-            melee = Image.open(BytesIO(image)).convert('RGBA')
-        elif index == 18:
-            slot_1 = Image.open(BytesIO(image)).convert('RGBA')
-            slot_1 = slot_1.resize((78, 78), Image.ANTIALIAS)
-        elif index == 19:
-            slot_2 = Image.open(BytesIO(image)).convert('RGBA')
-            slot_2 = slot_2.resize((78, 78), Image.ANTIALIAS)
-        elif index == 20:
-            slot_3 = Image.open(BytesIO(image)).convert('RGBA')
-            slot_3 = slot_3.resize((78, 78), Image.ANTIALIAS)
-        elif index == 21:
-            level_border = Image.open(BytesIO(image)).convert('RGBA')
-            level_border = level_border.resize((61, 25), Image.ANTIALIAS)
-        elif index == 22:
-            player_card = Image.open(BytesIO(image)).convert('RGBA')
-
-    # blur
-    box = (0, 410, 268, 473)
-    ic = player_card.crop(box)
-    ic = ic.filter(ImageFilter.GaussianBlur(radius=2))
-    player_card.paste(ic, box)
+    images = await asyncio.gather(*tasks)
+    decoded, melee, sprays, level_border, player_card = await asyncio.to_thread(
+        _decode_collection, [COLLECTION_SKINS[index] for index in missing], images
+    )
+    for index, image in zip(missing, decoded):
+        _SKIN_IMAGES.put(skin_keys[index], image)
+        skin_images[index] = image
 
     # skin paste
-    background.paste(classic, (389, 191), classic)
-    background.paste(shorty, (385, 388), shorty)
-    background.paste(frenzy, (388, 529), frenzy)
-    background.paste(ghost, (379, 725), ghost)
-    background.paste(sheriff, (379, 882), sheriff)
-    background.paste(stinger, (632, 195), stinger)
-    background.paste(spectre, (625, 367), spectre)
-    background.paste(bucky, (605, 552), bucky)
-    background.paste(judge, (602, 708), judge)
-    background.paste(bulldog, (984, 199), bulldog)
-    background.paste(guardian, (984, 380), guardian)
-    background.paste(phantom, (984, 547), phantom)
-    background.paste(vandal, (984, 709), vandal)
-    background.paste(marshal, (1352, 205), marshal)
-    background.paste(operator, (1353, 372), operator)
-    background.paste(ares, (1353, 545), ares)
-    background.paste(odin, (1353, 708), odin)
+    for skin, (_, _, _, position) in zip(skin_images, COLLECTION_SKINS):
+        background.paste(skin, position, skin)
 
     # malee paste
     width, height = melee.size
@@ -283,18 +259,14 @@ async def player_collection(loadout: Collection) -> discord.File:  # TODO: Objec
     background.paste(melee, position, melee)
 
     # spray paste
-    background.paste(slot_1, (190, 691), slot_1)
-    background.paste(slot_2, (190, 797), slot_2)
-    background.paste(slot_3, (190, 903), slot_3)
+    for spray, position in zip(sprays, SPRAY_POSITIONS):
+        background.paste(spray, position, spray)
 
     # player card paste
     player_card = player_card.resize((203, 486))
-    width, height = player_card.size
-    pixels = player_card.load()
-    for y in range(203, 486):
-        alpha = 255 - int((y - height * 0.55) / height / 0.35 * 255)
-        for x in range(width):
-            pixels[x, y] = pixels[x, y][:3] + (alpha,)
+    alpha = player_card.getchannel('A')
+    alpha.paste(_card_fade(*player_card.size), (0, 203))
+    player_card.putalpha(alpha)
     background.paste(player_card, (127, 176), player_card)
 
     # draw yellow bar
@@ -14,49 +14,19 @@ CREATE TABLE IF NOT EXISTS riot_accounts (
 ACCOUNT_INSERT_OR_UPDATE: Final[
     str
 ] = """
-INSERT 
+INSERT
 INTO
     riot_accounts
-    (user_id, guild_id, extras, date_signed)     
+    (user_id, guild_id, extras, date_signed, locale)
 VALUES
-    ($1, $2, $3, $4)     
+    ($1, $2, $3, $4, $5)
         ON CONFLICT (user_id) DO UPDATE
-            
-    SET
-        guild_id = $2,
-        extras = $3,
-        date_signed = $4,
-        locale = $5;
-"""
 
-ACCOUNT_UPSERT: Final[
-    str
-] = """
-   WITH upsert AS (UPDATE
-    riot_accounts 
-SET
-    user_id = $1,
-    guild_id = $2,
-    extras = $3,
-    date_signed = $4,
-    locale = $5
-WHERE
-    user_id = $6 RETURNING *) INSERT 
-    INTO
-        riot_accounts
-        (user_id, guild_id, extras, date_signed, locale) SELECT
-            $1,
-            $2,
-            $3,
-            $4,
-            $5
-        WHERE
-            NOT EXISTS (
-                SELECT
-                    * 
-                FROM
-                    upsert
-            );
+    SET
+        guild_id = EXCLUDED.guild_id,
+        extras = EXCLUDED.extras,
+        date_signed = EXCLUDED.date_signed,
+        locale = EXCLUDED.locale;
 """
 
 ACCOUNT_UPDATE_EXTRAS: Final[
@@ -85,7 +55,7 @@ ACCOUNT_SELECT: Final[
     str
 ] = """
 SELECT
-    *
+    user_id, guild_id, extras, date_signed, locale
 FROM
     riot_accounts
 WHERE
@@ -96,7 +66,7 @@ ACCOUNT_SELECT_ALL: Final[
     str
 ] = """
 SELECT
-    *
+    user_id, guild_id, extras, date_signed, locale
 FROM
     riot_accounts;
 """
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import asyncio
+import heapq
 import random
 import traceback
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 import discord
 import valorantx
@@ -18,6 +20,8 @@ from utils.views import ViewAuthor
 from ._database import ValorantUser
 from ._embeds import (
     MatchEmbed,
+    _kills_key,
+    deathmatch_placement,
     game_pass_e,
     mission_e,
     nightmarket_e,
@@ -35,6 +39,33 @@ if TYPE_CHECKING:
     from ._client import Client as ValorantClient, RiotAuth
 
 # V = TypeVar('V', bound='View')
+
+# skin collection order, four weapons per page, melee sorts at 3
+WEAPON_SORT_ORDER: Dict[str, int] = {
+    # page 1
+    'Phantom': 0,
+    'Vandal': 1,
+    'Operator': 2,
+    # page 2
+    'Classic': 4,
+    'Sheriff': 5,
+    'Spectre': 6,
+    'Marshal': 7,
+    # page 3
+    'Stinger': 8,
+    'Bucky': 9,
+    'Guardian': 10,
+    'Ares': 11,
+    # page 4
+    'Shorty': 12,
+    'Frenzy': 13,
+    'Ghost': 14,
+    'Judge': 15,
+    # page 5
+    'Bulldog': 16,
+    'Odin': 17,
+}
+
 # - multi-factor modal
 
 # TODO: from base Modal
@@ -97,11 +128,12 @@ class FeaturedBundleView(ViewAuthor):
         self.selected: bool = False
 
     def build_buttons(self, bundles: List[valorantx.Bundle]) -> None:
+        locale = str(self.v_locale)
         for index, bundle in enumerate(bundles, start=1):
             self.add_item(
                 FeaturedBundleButton(
                     other_view=self,
-                    label=str(index) + '. ' + bundle.name_localizations.from_locale(str(self.v_locale)),
+                    label=str(index) + '. ' + bundle.name_localizations.from_locale(locale),
                     custom_id=bundle.uuid,
                     style=discord.ButtonStyle.blurple,
                 )
@@ -244,11 +276,18 @@ class SwitchingViewX(ViewAuthor):
 class StoreSwitchX(SwitchingViewX):
     def __init__(self, interaction: Interaction, v_user: ValorantUser, client: ValorantClient) -> None:
         super().__init__(interaction, v_user, client, row=0)
+        # keyed by (puuid, offer uuids, locale), a new rotation has new offers
+        self._embeds: Dict[Tuple[str, Tuple[str, ...], str], List[discord.Embed]] = {}
 
-    @alru_cache(maxsize=32)
     async def get_embeds(self, riot_auth: RiotAuth, locale: Optional[valorantx.Locale]) -> List[discord.Embed]:
         sf = await self.v_client.fetch_store_front(riot_auth)  # type: ignore
-        return store_e(sf.get_store(), riot_auth, locale=locale)
+        store = sf.get_store()
+
+        key = (riot_auth.puuid, tuple(skin.uuid for skin in store.get_skins()), str(locale))
+        embeds = self._embeds.get(key)
+        if embeds is None:
+            embeds = self._embeds[key] = store_e(store, riot_auth, locale=locale)
+        return embeds
 
     async def start_view(self, riot_auth: RiotAuth, **kwargs: Any) -> None:
         embeds = await self.get_embeds(riot_auth, self.v_locale)
@@ -258,8 +297,8 @@ class StoreSwitchX(SwitchingViewX):
 class NightMarketSwitchX(SwitchingViewX):
     def __init__(self, interaction: Interaction, v_user: ValorantUser, client: ValorantClient) -> None:
         super().__init__(interaction, v_user, client, row=0)
+        self._embeds: Dict[Tuple[str, Tuple[str, ...], str], List[discord.Embed]] = {}
 
-    @alru_cache(maxsize=32)
     async def get_embeds(self, riot_auth: RiotAuth, locale: valorantx.Locale) -> List[discord.Embed]:
         sf = await self.v_client.fetch_store_front(riot_auth)  # type: ignore
         nightmarket = sf.get_nightmarket()
@@ -267,7 +306,11 @@ class NightMarketSwitchX(SwitchingViewX):
         if nightmarket is None:
             raise CommandError(f"{bold('Nightmarket')} is not available.")
 
-        return nightmarket_e(nightmarket, riot_auth, locale=locale)
+        key = (riot_auth.puuid, tuple(skin.uuid for skin in nightmarket.get_skins()), str(locale))
+        embeds = self._embeds.get(key)
+        if embeds is None:
+            embeds = self._embeds[key] = nightmarket_e(nightmarket, riot_auth, locale=locale)
+        return embeds
 
     async def start_view(self, riot_auth: RiotAuth, **kwargs: Any) -> None:
         embeds = await self.get_embeds(riot_auth, self.v_locale)
@@ -313,11 +356,15 @@ class GamePassSwitchX(SwitchingViewX, LattePages):
 class PointSwitchX(SwitchingViewX):
     def __init__(self, interaction: Interaction, v_user: ValorantUser, client: ValorantClient) -> None:
         super().__init__(interaction, v_user, client, row=0)
+        self._embeds: Dict[Tuple[str, str], discord.Embed] = {}
 
-    @alru_cache(maxsize=32)
     async def get_embeds(self, riot_auth: RiotAuth, locale: valorantx.Locale) -> discord.Embed:
-        wallet = await self.v_client.fetch_wallet(riot_auth)  # type: ignore
-        return wallet_e(wallet, riot_auth, locale=locale)
+        key = (riot_auth.puuid, str(locale))
+        embed = self._embeds.get(key)
+        if embed is None:
+            wallet = await self.v_client.fetch_wallet(riot_auth)  # type: ignore
+            embed = self._embeds[key] = wallet_e(wallet, riot_auth, locale=locale)
+        return embed
 
     async def start_view(self, riot_auth: RiotAuth, **kwargs: Any) -> None:
         embed = await self.get_embeds(riot_auth, self.v_locale)
@@ -327,12 +374,15 @@ class PointSwitchX(SwitchingViewX):
 class MissionSwitchX(SwitchingViewX):
     def __init__(self, interaction: Interaction, v_user: ValorantUser, client: ValorantClient) -> None:
         super().__init__(interaction, v_user, client, row=0)
+        self._embeds: Dict[Tuple[str, str], discord.Embed] = {}
 
-    @alru_cache(maxsize=5)
     async def get_embeds(self, riot_auth: RiotAuth) -> discord.Embed:
-
-        contracts = await self.v_client.fetch_contracts(riot_auth)  # type: ignore
-        return mission_e(contracts, riot_auth, locale=self.v_locale)
+        key = (riot_auth.puuid, str(self.v_locale))
+        embed = self._embeds.get(key)
+        if embed is None:
+            contracts = await self.v_client.fetch_contracts(riot_auth)  # type: ignore
+            embed = self._embeds[key] = mission_e(contracts, riot_auth, locale=self.v_locale)
+        return embed
 
     async def start_view(self, riot_auth: RiotAuth, **kwargs: Any) -> None:
         embed = await self.get_embeds(riot_auth)
@@ -347,6 +397,10 @@ class CollectionSwitchX(SwitchingViewX):
         self.mmr: Optional[valorantx.MMR] = None
         self._riot_auth: Optional[RiotAuth] = None
         self.pages: Optional[List[discord.Embed]] = None
+        # fetch cache, keyed by puuid so a re-created RiotAuth still hits
+        self._collections: Dict[str, valorantx.Collection] = {}
+        self._wallets: Dict[str, valorantx.Wallet] = {}
+        self._mmrs: Dict[str, valorantx.MMR] = {}
         # view cache
         self.skin_view = SkinCollectionViewX(self)
         self.spray_view = SprayCollectionView(self)
@@ -388,7 +442,7 @@ class CollectionSwitchX(SwitchingViewX):
         e.set_footer(text='Lv. {level}'.format(level=account_level))
 
         if player_title is not None:
-            e.title = player_title.text_localizations.from_locale(str(self.locale))
+            e.title = player_title.text_localizations.from_locale(str(self.v_locale))
 
         if player_card is not None:
             e.set_image(url=player_card.wide_icon)
@@ -397,17 +451,24 @@ class CollectionSwitchX(SwitchingViewX):
 
         return [e]
 
-    @alru_cache(maxsize=5)
     async def fetch_collection(self, riot_auth: RiotAuth) -> valorantx.Collection:
-        return await self.v_client.fetch_collection(riot_auth)  # type: ignore
+        collection = self._collections.get(riot_auth.puuid)
+        if collection is None:
+            collection = await self.v_client.fetch_collection(riot_auth)  # type: ignore
+            self._collections[riot_auth.puuid] = collection
+        return collection
 
-    @alru_cache(maxsize=5)
     async def fetch_wallet(self, riot_auth: RiotAuth) -> valorantx.Wallet:
-        return await self.v_client.fetch_wallet(riot_auth)  # type: ignore
+        wallet = self._wallets.get(riot_auth.puuid)
+        if wallet is None:
+            wallet = self._wallets[riot_auth.puuid] = await self.v_client.fetch_wallet(riot_auth)  # type: ignore
+        return wallet
 
-    @alru_cache(maxsize=5)
     async def fetch_mmr(self, riot_auth: RiotAuth) -> valorantx.MMR:
-        return await self.v_client.fetch_mmr(riot_auth)  # type: ignore
+        mmr = self._mmrs.get(riot_auth.puuid)
+        if mmr is None:
+            mmr = self._mmrs[riot_auth.puuid] = await self.v_client.fetch_mmr(riot_auth)  # type: ignore
+        return mmr
 
     async def start_view(self, riot_auth: RiotAuth, **kwargs: Any) -> None:
         self._riot_auth = riot_auth
@@ -429,16 +490,19 @@ class SprayCollectionView(ViewAuthor):  # Non-X
 
     @alru_cache(maxsize=5)
     async def build_pages(self, collection: valorantx.Collection) -> List[discord.Embed]:
-        embeds = []
-        for slot, spray in enumerate(collection.get_sprays(), start=1):
-            # TODO: slot number in spray model
-            embed = spray_loadout_e(spray, slot, locale=self.other_view.v_locale)
-
-            if embed._thumbnail.get('url'):
-                color_thief = await self.bot.get_or_fetch_colors(spray.uuid, embed._thumbnail['url'])
-                embed.colour = random.choice(color_thief)
+        locale = self.other_view.v_locale
+        sprays = list(collection.get_sprays())
+        # TODO: slot number in spray model
+        embeds = [spray_loadout_e(spray, slot, locale=locale) for slot, spray in enumerate(sprays, start=1)]
+
+        # fetch every spray's colours at once instead of one after another
+        icon_sprays = [(spray, embed) for spray, embed in zip(sprays, embeds) if embed._thumbnail.get('url')]
+        colors = await asyncio.gather(
+            *(self.bot.get_or_fetch_colors(spray.uuid, embed._thumbnail['url']) for spray, embed in icon_sprays)
+        )
+        for (spray, embed), color_thief in zip(icon_sprays, colors):
+            embed.colour = random.choice(color_thief)
 
-            embeds.append(embed)
         return embeds
 
     @ui.button(label=_('Back'), style=discord.ButtonStyle.green, custom_id='back', row=0)
@@ -458,7 +522,7 @@ class SprayCollectionView(ViewAuthor):  # Non-X
 
 class SkinCollectionSourceX(ListPageSource):
     def __init__(self, collection: valorantx.Collection):
-        super().__init__(sorted(list(collection.get_skins()), key=self.sort_skins), per_page=4)
+        super().__init__(sorted(collection.get_skins(), key=self.sort_skins), per_page=4)
 
     @staticmethod
     def sort_skins(
@@ -475,60 +539,18 @@ class SkinCollectionSourceX(ListPageSource):
         if weapon is None:
             return 0
 
-        # page 1
-        if weapon.display_name == 'Phantom':
-            return 0
-        elif weapon.display_name == 'Vandal':
-            return 1
-        elif weapon.display_name == 'Operator':
-            return 2
-        elif weapon.is_melee():
-            return 3
-
-        # page 2
-        elif weapon.display_name == 'Classic':
-            return 4
-        elif weapon.display_name == 'Sheriff':
-            return 5
-        elif weapon.display_name == 'Spectre':
-            return 6
-        elif weapon.display_name == 'Marshal':
-            return 7
-
-        # page 3
-        elif weapon.display_name == 'Stinger':
-            return 8
-        elif weapon.display_name == 'Bucky':
-            return 9
-        elif weapon.display_name == 'Guardian':
-            return 10
-        elif weapon.display_name == 'Ares':
-            return 11
-
-        # page 4
-        elif weapon.display_name == 'Shorty':
-            return 12
-        elif weapon.display_name == 'Frenzy':
-            return 13
-        elif weapon.display_name == 'Ghost':
-            return 14
-        elif weapon.display_name == 'Judge':
-            return 15
-
-        # page 5
-        elif weapon.display_name == 'Bulldog':
-            return 16
-        elif weapon.display_name == 'Odin':
-            return 17
-        else:
-            return 18
+        order = WEAPON_SORT_ORDER.get(weapon.display_name)
+        if order is None:
+            return 3 if weapon.is_melee() else 18
+        return order
 
     async def format_page(
         self,
         view: SkinCollectionViewX,
         entries: List[Union[valorantx.SkinLoadout, valorantx.SkinLevelLoadout, valorantx.SkinChromaLoadout]],
     ) -> List[discord.Embed]:
-        return [skin_loadout_e(skin, locale=view.other_view.v_locale) for skin in entries]
+        locale = view.other_view.v_locale
+        return [skin_loadout_e(skin, locale=locale) for skin in entries]
 
 
 class SkinCollectionViewX(ViewAuthor, LattePages):
@@ -567,21 +589,22 @@ class SelectMatchHistoryX(ui.Select['CarrierSwitchX']):
             enemy_team = match.get_enemy_team()
             me_team = match.get_me_team()
 
-            players = sorted(match.get_players(), key=lambda p: p.kills, reverse=True)
-
             left_team_score = me_team.rounds_won if me_team is not None else 0
             right_team_score = enemy_team.rounds_won if enemy_team is not None else 0
 
             if match.game_mode == valorantx.GameModeType.deathmatch:
-                if match.me.is_winner():
+                # only the top two by kills are shown
+                players = heapq.nlargest(2, match.get_players(), key=_kills_key)
+                is_winner = match.me.is_winner()
+                if is_winner:
                     _2nd_place = (players[1]) if len(players) > 1 else None
                     _1st_place = match.me
                 else:
                     _2nd_place = match.me
                     _1st_place = (players[0]) if len(players) > 0 else None
 
-                left_team_score = (_1st_place.kills if match.me.is_winner() else _2nd_place.kills) if _1st_place else 0
-                right_team_score = (_2nd_place.kills if match.me.is_winner() else _1st_place.kills) if _2nd_place else 0
+                left_team_score = (_1st_place.kills if is_winner else _2nd_place.kills) if _1st_place else 0
+                right_team_score = (_2nd_place.kills if is_winner else _1st_place.kills) if _2nd_place else 0
 
             self.add_option(
                 label='{won} - {lose}'.format(won=left_team_score, lose=right_team_score),
@@ -637,38 +660,21 @@ class CarrierPageSourceX(ListPageSource):
         )
 
         if match.game_mode == valorantx.GameModeType.deathmatch:
-            players = match.get_players()
-
-            if match.me.is_winner():
-                _2nd_place = (sorted(players, key=lambda p: p.kills, reverse=True)[1]) if len(players) > 1 else None
+            is_winner = me.is_winner()
+            if is_winner:
+                # the winner only needs the runner-up
+                players = heapq.nlargest(2, match.get_players(), key=_kills_key)
+                _2nd_place = players[1] if len(players) > 1 else None
                 _1st_place = me
+                result = '1ST PLACE'
             else:
+                players = sorted(match.get_players(), key=_kills_key, reverse=True)
                 _2nd_place = me
-                _1st_place = (sorted(players, key=lambda p: p.kills, reverse=True)[0]) if len(players) > 0 else None
+                _1st_place = players[0] if len(players) > 0 else None
+                result = deathmatch_placement(players, me) or result
 
-            left_team_score = (_1st_place.kills if match.me.is_winner() else _2nd_place.kills) if _1st_place else 0
-            right_team_score = (_2nd_place.kills if match.me.is_winner() else _1st_place.kills) if _2nd_place else 0
-
-            if match.me.is_winner():
-                result = '1ST PLACE'
-            else:
-                players = sorted(match.get_players(), key=lambda p: p.kills, reverse=True)
-                for index, player in enumerate(players, start=1):
-                    player_before = players[index - 1]
-                    player_after = players[index] if len(players) > index else None
-                    if player == me:
-                        if index == 2:
-                            result = '2ND PLACE'
-                        elif index == 3:
-                            result = '3RD PLACE'
-                        else:
-                            result = '{}TH PLACE'.format(index)
-
-                        if player_before is not None or player_after is not None:
-                            if player_before.kills == player.kills:
-                                result += ' (TIED)'
-                            elif player_after.kills == player.kills:
-                                result += ' (TIED)'
+            left_team_score = (_1st_place.kills if is_winner else _2nd_place.kills) if _1st_place else 0
+            right_team_score = (_2nd_place.kills if is_winner else _1st_place.kills) if _2nd_place else 0
 
         elif not match.me.is_winner():
             embed.colour = ResultColor.lose
@@ -755,14 +761,12 @@ class CarrierSwitchX(SwitchingViewX, LattePages):
 
 class MatchDetailsPageSourceX(ListPageSource):
     def __init__(self, match_details: valorantx.MatchDetails) -> None:
-        total_pages = 3 if match_details.game_mode != valorantx.GameModeType.deathmatch else 2
-        super().__init__(list(i for i in range(0, total_pages)), per_page=1)
-        embeds = MatchEmbed(match_details)
-        self.desktop = embeds.get_desktop()
-        self.mobile = embeds.get_mobile()
+        # pages are only built for the layout that is actually shown
+        self.embeds = MatchEmbed(match_details)
+        super().__init__(list(range(self.embeds.page_count)), per_page=1)
 
     def format_page(self, menu: Any, page: int) -> discord.Embed:
-        return self.mobile[page] if menu.is_on_mobile else self.desktop[page]
+        return self.embeds.get_mobile()[page] if menu.is_on_mobile else self.embeds.get_desktop()[page]
 
 
 class MatchDetailsViewX(ViewAuthor, LattePages):
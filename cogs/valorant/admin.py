@@ -37,6 +37,7 @@ class Admin(MixinMeta):  # noqa
 
         if cache.value == 'bundle' or cache.value == 'all':
             self.get_all_bundles.cache_clear()  # type: ignore
+            self._auto_complete_names.clear()  # type: ignore
         if cache.value == 'featured_bundle' or cache.value == 'all':
             self.get_featured_bundle.cache_clear()  # type: ignore
         if cache.value == 'locale' or cache.value == 'all':
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
+import asyncio
 import contextlib
 import json
 import logging
+import operator
 import random
 import re
 from abc import ABC
 from functools import lru_cache
-from typing import TYPE_CHECKING, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple, Union
 
 import aiohttp
 import discord
@@ -33,8 +35,20 @@ from utils.views import BaseView, ViewAuthor
 
 # local
 from ._client import Client as ValorantClient, RiotAuth
+from ._custom import CONTENT_TIER_COLOURS
 from ._database import Database, ValorantUser
-from ._embeds import Embed, agent_e, buddy_e, bundle_e, nightmarket_e, patch_notes_e, player_card_e, spray_e, store_e
+from ._embeds import (
+    SKIN_NAMES,
+    Embed,
+    agent_e,
+    buddy_e,
+    bundle_e,
+    nightmarket_e,
+    patch_notes_e,
+    player_card_e,
+    spray_e,
+    store_e,
+)
 from ._enums import PointEmoji, ValorantLocale as VLocale
 from ._errors import NoAccountsLinked
 from ._views import (  # StatsView,
@@ -72,6 +86,8 @@ MISSING = utils.MISSING
 RIOT_ID_REGEX = r'(^.{1,16})+[#]+(.{1,5})$'
 RIOT_ID_BAD_REGEX = r'[|^&+\-%*/=!>()<>?;:\\\'"\[\]{}_,]'
 
+_name_key = operator.itemgetter(0)
+
 
 # - main cog
 
@@ -98,8 +114,8 @@ class Valorant(Admin, Notify, Events, ContextMenu, ErrorHandler, commands.Cog, m
         # database
         self.db: Database = Database(bot)
 
-        # auto complete
-        # self._auto_complete: Dict[str, List[Choice]] = {}
+        # auto complete, (command, locale) -> (localized name, value) sorted by name
+        self._auto_complete_names: Dict[Tuple[str, str], List[Tuple[str, Any]]] = {}
 
         self.add_context_menu()
 
@@ -323,7 +339,18 @@ class Valorant(Admin, Notify, Events, ContextMenu, ErrorHandler, commands.Cog, m
     def build_auto_complete_choices(self) -> None:
         ...
 
+    def _localized_names(self, command: str, values: Iterable[Any], locale: str) -> List[Tuple[str, Any]]:
+        key = (command, locale)
+        names = self._auto_complete_names.get(key)
+        if names is None:
+            names = sorted(((value.name_localizations.from_locale(locale), value) for value in values), key=_name_key)
+            self._auto_complete_names[key] = names
+        return names
+
     def cache_clear(self):
+        self._auto_complete_names.clear()
+        SKIN_NAMES.clear()
+        CONTENT_TIER_COLOURS.clear()
         self.fetch_user.cache_clear()
         self.get_all_agents.cache_clear()
         self.get_all_bundles.cache_clear()
@@ -621,6 +648,17 @@ class Valorant(Admin, Notify, Events, ContextMenu, ErrorHandler, commands.Cog, m
 
         embeds_stuffs = []
 
+        # fetch every bundle's colours at once instead of one after another
+        icon_bundles = [bundle for bundle in bundles if bundle.display_icon_2 is not None]
+        bundle_colors = dict(
+            zip(
+                (bundle.uuid for bundle in icon_bundles),
+                await asyncio.gather(
+                    *(self.bot.get_or_fetch_colors(bundle.uuid, bundle.display_icon_2) for bundle in icon_bundles)
+                ),
+            )
+        )
+
         for bundle in bundles:
 
             # build embeds stuff
@@ -634,8 +672,7 @@ class Valorant(Admin, Notify, Events, ContextMenu, ErrorHandler, commands.Cog, m
 
             if bundle.display_icon_2 is not None:
                 s_embed.set_thumbnail(url=bundle.display_icon_2)
-                color_thief = await self.bot.get_or_fetch_colors(bundle.uuid, bundle.display_icon_2)
-                s_embed.colour = random.choice(color_thief)
+                s_embed.colour = random.choice(bundle_colors[bundle.uuid])
 
             embeds_stuffs.append(s_embed)
 
@@ -943,23 +980,20 @@ class Valorant(Admin, Notify, Events, ContextMenu, ErrorHandler, commands.Cog, m
     @eventpass.autocomplete('event')
     async def get_all_auto_complete(self, interaction: Interaction, current: str) -> List[Choice[str]]:
 
-        locale = self.v_locale(interaction.locale)
+        locale = str(self.v_locale(interaction.locale))
 
         results: List[Choice[str]] = []
         mex_index = 25
 
-        # TODO: cache choices
-
         if interaction.command is self.bundle:
 
             bundle_list = self.get_all_bundles()
             namespace = interaction.namespace.bundle
             mex_index = 15
 
-            for bundle in sorted(bundle_list, key=lambda a: a.name_localizations.from_locale(str(locale))):
-                if bundle.name_localizations.from_locale(str(locale)).lower().startswith(namespace.lower()):
-
-                    bundle_name = bundle.name_localizations.from_locale(str(locale))
+            namespace_lower = namespace.lower()
+            for bundle_name, bundle in self._localized_names(interaction.command.name, bundle_list, locale):
+                if bundle_name.lower().startswith(namespace_lower):
 
                     index = 2
                     for choice in results:
@@ -976,8 +1010,10 @@ class Valorant(Admin, Notify, Events, ContextMenu, ErrorHandler, commands.Cog, m
             value_list = self.get_all_seasons()
             namespace = interaction.namespace.season
 
+            namespace_lower = namespace.lower()
             for value in sorted(value_list, key=lambda a: a.start_time):
-                if value.name_localizations.from_locale(str(locale)).lower().startswith(namespace.lower()):
+                value_name = value.name_localizations.from_locale(locale)
+                if value_name.lower().startswith(namespace_lower):
 
                     parent = value.parent
                     parent_name = ''
@@ -985,9 +1021,9 @@ class Valorant(Admin, Notify, Events, ContextMenu, ErrorHandler, commands.Cog, m
                         if value.uuid != '0df5adb9-4dcb-6899-1306-3e9860661dd3':  # closed beta
                             continue
                     else:
-                        parent_name = parent.name_localizations.from_locale(str(locale)) + ' '
+                        parent_name = parent.name_localizations.from_locale(locale) + ' '
 
-                    value_name = parent_name + value.name_localizations.from_locale(str(locale))
+                    value_name = parent_name + value_name
 
                     if value_name == ' ':
                         continue
@@ -1029,10 +1065,9 @@ class Valorant(Admin, Notify, Events, ContextMenu, ErrorHandler, commands.Cog, m
             else:
                 return []
 
-            for value in sorted(value_list, key=lambda a: a.name_localizations.from_locale(str(locale))):
-                if value.name_localizations.from_locale(str(locale)).lower().startswith(namespace.lower()):
-
-                    value_name = value.name_localizations.from_locale(str(locale))
+            namespace_lower = namespace.lower()
+            for value_name, value in self._localized_names(interaction.command.name, value_list, locale):
+                if value_name.lower().startswith(namespace_lower):
 
                     if value_name == ' ':
                         continue